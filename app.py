@@ -1,7 +1,8 @@
 import logging
+
 import streamlit as st
-from src.models.section import BeamSection
-from src.ui.tabs import flexure_tab, shear_tab, torsion_tab, report_tab
+
+from src.ui.cache import get_section
 from src.ui.design_state import init_design_state
 
 logging.basicConfig(level=logging.INFO, format="%(name)s - %(levelname)s - %(message)s")
@@ -23,7 +24,7 @@ cover = st.sidebar.number_input("Recubrimiento [cm]", 2.0, 10.0, 4.0)
 
 # Create Section Object
 try:
-    section = BeamSection(b, h, fc, fy, cover)
+    section = get_section(b, h, fc, fy, cover)
 except ValueError as e:
     st.sidebar.error(str(e))
     st.stop()
@@ -34,14 +35,24 @@ init_design_state(st.session_state)
 
 tab_flexure, tab_shear, tab_torsion, tab_report = st.tabs(["🔄 Flexión", "✂️ Cortante", "🌀 Torsión", "📄 Reporte"])
 
+# Tab modules are imported next to the tab that renders them; after the first
+# run they come from sys.modules, so reruns only pay a dict lookup.
 with tab_flexure:
+    from src.ui.tabs import flexure_tab
+
     flexure_tab.render(section)
 
 with tab_shear:
+    from src.ui.tabs import shear_tab
+
     shear_tab.render(section)
-    
+
 with tab_torsion:
+    from src.ui.tabs import torsion_tab
+
     torsion_tab.render(section)
-    
+
 with tab_report:
+    from src.ui.tabs import report_tab
+
     report_tab.render(section)
@@ -1,6 +1,6 @@
-import os
-import sys
 import subprocess
+import sys
+
 
 def run():
     # Construct the command to run streamlit via python module
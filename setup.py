@@ -0,0 +1,24 @@
+"""Optional ahead-of-time compilation of the flexure hot path with mypyc.
+
+    python setup.py build_ext --inplace
+
+builds C extensions next to src/models/flexure.py and src/models/section.py;
+Python imports them in place of the sources. Delete the generated .so/.pyd
+files to go back to the pure-Python modules used during development.
+Without mypy installed, no extensions are built and the package stays
+pure Python.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify(["src/models/flexure.py", "src/models/section.py"])
+
+setup(
+    name="rc-beam-designer",
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,10 @@
+"""Python version shims."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+# ``dataclass(slots=True)`` needs Python 3.10; on 3.9 the classes fall back to
+# a regular ``__dict__`` and behave the same.
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
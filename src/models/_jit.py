@@ -0,0 +1,34 @@
+"""Optional Numba support for the numeric kernels.
+
+Kernels are decorated with :func:`njit`. When Numba is installed they are
+compiled to machine code; otherwise the decorator is a no-op and the kernels
+run as plain Python with the same results. Parallel loops use :data:`prange`,
+which falls back to ``range``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+    from numba import prange
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _numba_njit = None  # type: ignore[assignment]
+    prange = range  # type: ignore[misc, assignment]
+    HAVE_NUMBA = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Drop-in for ``numba.njit`` that degrades to the identity decorator."""
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
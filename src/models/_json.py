@@ -0,0 +1,25 @@
+"""Optional orjson support for the JSON report export.
+
+When orjson is installed it serializes the payload; otherwise the standard
+library ``json`` module produces the same indented UTF-8 document.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+    HAVE_ORJSON = False
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize obj as UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,25 @@
+"""Process-wide settings for bulk design runs (optimizers, parameter sweeps)."""
+
+from __future__ import annotations
+
+import logging
+
+MODELS_LOGGER = "src.models"
+
+
+def configure_for_design_sweep() -> None:
+    """
+    Quiet the calculation loggers before evaluating many designs.
+
+    Sets the ``src.models`` logger to WARNING, stops propagation to the root
+    logger and attaches a NullHandler, so the guarded per-call INFO logging in
+    calculate_flexure / calculate_shear / calculate_torsion reduces to a
+    cached level check. Warnings and errors are still emitted to handlers
+    attached to ``src.models`` itself. Call once before the sweep; this
+    changes logging for the whole process.
+    """
+    logger = logging.getLogger(MODELS_LOGGER)
+    logger.setLevel(logging.WARNING)
+    logger.propagate = False
+    if not any(isinstance(h, logging.NullHandler) for h in logger.handlers):
+        logger.addHandler(logging.NullHandler())
@@ -32,6 +32,13 @@ AL_MIN_COEFF = 0.42          # 5/12 for MPa units (ACI Eq 9.6.4.3)
 PHI_SHEAR = 0.75
 PHI_TORSION = 0.75
 
+# No shear reinforcement required while Vu <= 0.5 * phi * Vc = NO_STIRRUPS_COEFF * sqrt(fc) * bw * d
+NO_STIRRUPS_COEFF = 0.5 * PHI_SHEAR * VC_COEFF * LAMBDA_NWC
+
+# Phi-scaled torsion coefficients: phi*T_th and phi*T_cr per unit torsion factor
+PHI_T_TH_COEFF = PHI_TORSION * T_TH_COEFF
+PHI_T_CR_COEFF = PHI_TORSION * T_CR_COEFF
+
 # Spacing limits (mm)
 S_MAX_NORMAL = 600           # d/2 or 600 mm
 S_MAX_HEAVY = 300            # d/4 or 300 mm
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.models.result_types import ShearResult, TorsionResult
+from src.models.shear import _shear_result, calculate_shear
+from src.models.shear_kernels import _compute_Vc
+from src.models.torsion import _torsion_result, calculate_torsion
+
+if TYPE_CHECKING:
+    from src.models.section import BeamSection
+
+
+def calculate_shear_and_torsion(section: BeamSection, Vu: float, Tu: float, n_legs: int = 2,
+                                stirrup_diameter: float = 0.95, *, Vu_torsion: float | None = None,
+                                with_trace: bool = True) -> tuple[ShearResult, TorsionResult]:
+    """
+    Shear and torsion checks for one section and load combination.
+
+    Same results as calculate_shear followed by calculate_torsion, but the
+    section is validated once and the concrete shear capacity Vc is computed
+    once and used by both checks.
+
+    Args:
+        section: The beam section object.
+        Vu: Ultimate Shear Force (kN).
+        Tu: Ultimate Torsion (kNm).
+        n_legs: Number of legs for stirrups (usually 2).
+        stirrup_diameter: Diameter of stirrup bar (cm).
+        Vu_torsion: Shear concurrent with Tu for the torsion check (kN); defaults to Vu.
+        with_trace: Record ACI TraceCheck entries (empty traces when False).
+
+    Returns:
+        (ShearResult, TorsionResult)
+    """
+    if Vu_torsion is None:
+        Vu_torsion = Vu
+
+    if section.geometry_errors:
+        return (
+            calculate_shear(section, Vu, n_legs, stirrup_diameter, with_trace=with_trace),
+            calculate_torsion(section, Tu, Vu_torsion, with_trace=with_trace),
+        )
+
+    Vc = _compute_Vc(float(section.sqrt_fc), float(section.b_mm), float(section.d_mm))
+    return (
+        _shear_result(section, Vu, n_legs, stirrup_diameter, Vc, with_trace),
+        _torsion_result(section, Tu, Vu_torsion, Vc, with_trace),
+    )
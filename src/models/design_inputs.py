@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any
 
+from src.models._compat import DATACLASS_SLOTS
 
-@dataclass
+# Stirrup bar label -> nominal diameter (cm)
+STIRRUP_BAR_DIAMETERS = {'#3 (3/8")': 0.95, '#4 (1/2")': 1.27}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class DesignInputs:
     mu_pos: float = 100.0
     mu_neg: float = 0.0
@@ -16,4 +21,13 @@ class DesignInputs:
     n_bars_torsion: int = 6
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "mu_pos": self.mu_pos,
+            "mu_neg": self.mu_neg,
+            "vu": self.vu,
+            "tu": self.tu,
+            "vu_torsion": self.vu_torsion,
+            "n_legs": self.n_legs,
+            "stirrup_bar": self.stirrup_bar,
+            "n_bars_torsion": self.n_bars_torsion,
+        }
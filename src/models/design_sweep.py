@@ -0,0 +1,121 @@
+"""Parallel shear + torsion evaluation over b x h design grids."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from src.models._jit import njit, prange
+from src.models.shear import _compute_stirrup_area
+from src.models.shear_kernels import SHEAR_NO_STIRRUPS, SHEAR_VS_OVER_MAX, _compute_Vc, _shear_core
+from src.models.torsion_kernels import TORSION_REQUIRED, TORSION_SECTION_INADEQUATE, _torsion_core
+from src.models.units import MM2_PER_CM2, MM_PER_CM, N_PER_KN, NMM_PER_KNM
+
+# Sweep status flags (bitwise OR; 0 means both checks pass)
+SWEEP_OK = 0
+SWEEP_SHEAR_FAIL = 1
+SWEEP_TORSION_FAIL = 2
+SWEEP_INVALID_GEOMETRY = 4
+
+
+@njit("void(f8[:], f8[:], f8, f8, f8, f8, f8, f8, i8[:, :], f8[:, :], f8[:, :], f8[:, :])",
+      parallel=True, cache=True, fastmath=True)
+def _sweep_kernel(b_cm: np.ndarray, h_cm: np.ndarray, fc: float, fy: float, cover_cm: float,
+                  Vu_N: float, Tu_Nmm: float, Av: float, out_status: np.ndarray,
+                  out_s_req: np.ndarray, out_At_s: np.ndarray, out_Al: np.ndarray) -> None:
+    """Fill the (len(b_cm), len(h_cm)) output arrays; rows run in parallel."""
+    sqrt_fc = math.sqrt(fc)
+    cover_mm = cover_cm * MM_PER_CM
+    for i in prange(b_cm.shape[0]):
+        b_mm = b_cm[i] * MM_PER_CM
+        for j in range(h_cm.shape[0]):
+            h_mm = h_cm[j] * MM_PER_CM
+            d_mm = h_mm - cover_mm
+
+            # Same rules as validate_section_geometry
+            if (b_mm <= 0 or h_mm <= 0 or cover_mm <= 0 or d_mm <= 0
+                    or cover_mm >= min(b_mm, h_mm) / 2):
+                out_status[i, j] = SWEEP_INVALID_GEOMETRY
+                out_s_req[i, j] = np.nan
+                out_At_s[i, j] = np.nan
+                out_Al[i, j] = np.nan
+                continue
+
+            Vc = _compute_Vc(sqrt_fc, b_mm, d_mm)
+            status = SWEEP_OK
+
+            code, _, _, s_final, _ = _shear_core(sqrt_fc, fy, b_mm, d_mm, Vu_N, Av, Vc)
+            if code == SHEAR_VS_OVER_MAX:
+                status |= SWEEP_SHEAR_FAIL
+                out_s_req[i, j] = np.nan
+            elif code == SHEAR_NO_STIRRUPS:
+                out_s_req[i, j] = np.nan
+            else:
+                out_s_req[i, j] = s_final / MM_PER_CM
+
+            # cover < min(b, h)/2 above guarantees a positive Aoh
+            x1 = b_mm - 2 * cover_mm
+            y1 = h_mm - 2 * cover_mm
+            t_code, _, _, _, _, _, _, At_s_req, Al_final = _torsion_core(
+                Tu_Nmm, Vu_N, sqrt_fc, fy, b_mm, d_mm,
+                b_mm * h_mm, 2 * (b_mm + h_mm), x1 * y1, 2 * (x1 + y1), Vc,
+            )
+            if t_code == TORSION_SECTION_INADEQUATE:
+                status |= SWEEP_TORSION_FAIL
+                out_At_s[i, j] = np.nan
+                out_Al[i, j] = np.nan
+            elif t_code == TORSION_REQUIRED:
+                out_At_s[i, j] = At_s_req
+                out_Al[i, j] = Al_final / MM2_PER_CM2
+            else:
+                out_At_s[i, j] = 0.0
+                out_Al[i, j] = 0.0
+
+            out_status[i, j] = status
+
+
+def sweep_shear_torsion(b: ArrayLike, h: ArrayLike, fc: float, fy: float, cover: float,
+                        Vu: float, Tu: float, n_legs: int = 2,
+                        stirrup_diameter: float = 0.95) -> dict[str, np.ndarray]:
+    """
+    Shear and torsion checks for every (b, h) pair of a design grid.
+
+    Evaluates the same kernels as calculate_shear and calculate_torsion for
+    len(b) x len(h) sections, with the rows of the grid spread over all
+    CPU cores when Numba is installed (thread count: NUMBA_NUM_THREADS).
+    No trace is produced.
+
+    Args:
+        b: Candidate widths (cm).
+        h: Candidate heights (cm).
+        fc, fy: Material strengths (MPa).
+        cover: Concrete cover (cm).
+        Vu: Ultimate Shear Force (kN), also used as the shear concurrent with Tu.
+        Tu: Ultimate Torsion (kNm).
+        n_legs: Number of legs for stirrups (usually 2).
+        stirrup_diameter: Diameter of stirrup bar (cm).
+
+    Returns:
+        dict of (len(b), len(h)) arrays: status (SWEEP_* flags, 0 when both
+        checks pass), s_req (cm; NaN where calculate_shear returns None),
+        At_s_req (mm2/mm) and Al_req (cm2), NaN where the section fails torsion
+        or is invalid.
+    """
+    b_arr = np.ascontiguousarray(b, dtype=np.float64).ravel()
+    h_arr = np.ascontiguousarray(h, dtype=np.float64).ravel()
+    shape = (b_arr.size, h_arr.size)
+    out = {
+        "status": np.empty(shape, dtype=np.int64),
+        "s_req": np.empty(shape),
+        "At_s_req": np.empty(shape),
+        "Al_req": np.empty(shape),
+    }
+    _, Av = _compute_stirrup_area(stirrup_diameter, n_legs)
+    _sweep_kernel(
+        b_arr, h_arr, float(fc), float(fy), float(cover),
+        float(abs(Vu) * N_PER_KN), float(abs(Tu) * NMM_PER_KNM), float(Av),
+        out["status"], out["s_req"], out["At_s_req"], out["Al_req"],
+    )
+    return out
@@ -1,22 +1,34 @@
 from __future__ import annotations
 
 import logging
-import math
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 from src.models.aci_constants import (
+    BETA1_HIGH,
+    BETA1_LOW,
     EPSILON_CU,
     EPSILON_T_COMPRESSION,
     EPSILON_T_TENSION,
+    FC_BETA1_LOWER,
+    FC_BETA1_UPPER,
     MIN_RHO_COEFF_1,
     MIN_RHO_COEFF_2,
     PHI_COMPRESSION,
     PHI_TENSION,
     WHITNEY_COEFF,
 )
-from src.models.result_types import FlexureResult, TraceCheck
-from src.models.units import cm_to_mm, kNm_to_Nmm, mm2_to_cm2, mm_to_cm
-from src.models.validation import normalize_load_with_policy, validate_section_geometry
+from src.models.flexure_numba import (
+    PHI_SLOPE,
+    PHI_TRANSITION_P0,
+    PHI_TRANSITION_P1,
+    _iterate_phi_nb,
+)
+from src.models.result_types import STATUS_CODE_DTYPE, FlexureResult, Status, TraceCheck
+from src.models.units import MM2_PER_CM2, MM_PER_CM, NMM_PER_KNM, kNm_to_Nmm, mm2_to_cm2, mm_to_cm
+from src.models.validation import normalize_load_with_policy
 
 if TYPE_CHECKING:
     from src.models.section import BeamSection
@@ -24,115 +36,118 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def _compute_As_min(fc: float, fy: float, b_mm: float, d_mm: float) -> float:
-    """Minimum reinforcement per ACI 318 Table 9.6.1.2."""
-    min_rho_1 = MIN_RHO_COEFF_1 * math.sqrt(fc) / fy
-    min_rho_2 = MIN_RHO_COEFF_2 / fy
-    return max(min_rho_1, min_rho_2) * b_mm * d_mm
-
-
-def _compute_phi(epsilon_t: float) -> float:
-    """Compute strength reduction factor based on net tensile strain."""
-    if epsilon_t >= EPSILON_T_TENSION:
-        return PHI_TENSION
-    elif epsilon_t <= EPSILON_T_COMPRESSION:
-        return PHI_COMPRESSION
-    else:
-        return PHI_COMPRESSION + 0.25 * (epsilon_t - EPSILON_T_COMPRESSION) / (EPSILON_T_TENSION - EPSILON_T_COMPRESSION)
-
+class _PhiResult(NamedTuple):
+    """Solved flexural state; when error is True only phi is meaningful."""
 
-def _iterate_phi(section: BeamSection, Mu_Nmm: float, b_mm: float, d_mm: float,
-                 fc: float, fy: float) -> dict:
-    """Iterative phi-convergence loop for flexural design."""
-    phi = PHI_TENSION
-
-    # Quadratic coefficients: (fy^2 / (2*0.85*fc*b)) * As^2 - (fy*d) * As + Mu/phi = 0
-    term_A = (fy ** 2) / (2 * WHITNEY_COEFF * fc * b_mm)
-    term_B = -fy * d_mm
+    error: bool
+    As_req: float
+    a: float
+    c: float
+    epsilon_t: float
+    phi: float
 
-    As_req = 0.0
-    a = 0.0
-    c = 0.0
-    epsilon_t = 1.0
 
-    for i in range(10):
-        term_C = Mu_Nmm / phi
-        delta = term_B ** 2 - 4 * term_A * term_C
+class _PhiBatch(NamedTuple):
+    """Vectorized _PhiResult: one array per field."""
 
-        if delta < 0:
-            logger.warning("Section overloaded: discriminant < 0 at phi=%.4f", phi)
-            return {"error": True, "phi": phi}
+    error: np.ndarray
+    As_req: np.ndarray
+    a: np.ndarray
+    c: np.ndarray
+    epsilon_t: np.ndarray
+    phi: np.ndarray
 
-        As_req = (-term_B - math.sqrt(delta)) / (2 * term_A)
-        a = As_req * fy / (WHITNEY_COEFF * fc * b_mm)
-        c = a / section.beta1
 
-        if c <= 0:
-            epsilon_t = 1.0
-            phi = PHI_TENSION
-            break
+def _compute_As_min(sqrt_fc: float, fy: float, b_mm: float, d_mm: float) -> float:
+    """Minimum reinforcement per ACI 318 Table 9.6.1.2."""
+    min_rho_1 = MIN_RHO_COEFF_1 * sqrt_fc / fy
+    min_rho_2 = MIN_RHO_COEFF_2 / fy
+    return max(min_rho_1, min_rho_2) * b_mm * d_mm
 
-        epsilon_t = EPSILON_CU * (d_mm - c) / c
-        new_phi = _compute_phi(epsilon_t)
 
-        if abs(new_phi - phi) < 0.001:
-            phi = new_phi
-            break
-        phi = new_phi
-        logger.debug("Iteration %d: phi=%.4f, epsilon_t=%.5f", i, phi, epsilon_t)
+def _iterate_phi(section: BeamSection, Mu_Nmm: float, b_mm: float, d_mm: float,
+                 fc: float, fy: float) -> _PhiResult:
+    """Solve the phi-consistent flexural state (compiled kernel wrapper)."""
+    result = _PhiResult._make(_iterate_phi_nb(
+        float(Mu_Nmm), float(section.flex_term_A), float(section.flex_term_B),
+        float(b_mm), float(d_mm), float(fc), float(fy), float(section.beta1)
+    ))
 
-    return {
-        "error": False, "As_req": As_req, "a": a, "c": c,
-        "epsilon_t": epsilon_t, "phi": phi
-    }
+    if result.error:
+        logger.warning("Section overloaded: discriminant < 0 at phi=%.4f", result.phi)
+    return result
 
 
-def calculate_flexure(section: BeamSection, Mu: float) -> FlexureResult:
+def _iterate_phi_batch(Mu_Nmm: np.ndarray, term_A: float | np.ndarray, term_B: float | np.ndarray,
+                       b_mm: float | np.ndarray, d_mm: float | np.ndarray, fc: float | np.ndarray,
+                       fy: float | np.ndarray, beta1: float | np.ndarray) -> _PhiBatch:
     """
-    Calculate required reinforcement for a given ultimate moment.
+    Vectorized closed-form phi solve over an array of moments.
 
-    Args:
-        section: The beam section object.
-        Mu: Ultimate Moment (kNm).
+    Section properties may be scalars or arrays broadcastable against Mu_Nmm.
 
-    Returns:
-        dict with keys: As_calc, As_min, As_design, rho, phi, epsilon_t, status, c, a
+    Evaluates the tension, transition and compression branches of
+    _iterate_phi_nb for every moment and selects the valid one per entry.
     """
-    logger.info("Flexure calc: Mu=%.2f kNm, b=%.1f h=%.1f", Mu, section.b, section.h)
+    K = WHITNEY_COEFF * fc * b_mm * beta1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 1. Tension-controlled
+        delta_t = term_B ** 2 - 4 * term_A * (Mu_Nmm / PHI_TENSION)
+        As_t = (-term_B - np.sqrt(np.maximum(delta_t, 0.0))) / (2 * term_A)
+        c_t = As_t * fy / (WHITNEY_COEFF * fc * b_mm) / beta1
+        eps_t = EPSILON_CU * (d_mm - c_t) / c_t
+
+        # 2. Transition
+        qa = -0.5 * K * PHI_TRANSITION_P0 * beta1
+        qb = K * d_mm * (PHI_TRANSITION_P0 - 0.5 * PHI_TRANSITION_P1 * beta1)
+        qc = K * PHI_TRANSITION_P1 * d_mm * d_mm - Mu_Nmm
+        disc = qb * qb - 4 * qa * qc
+        c_tr = (-qb + np.sqrt(np.maximum(disc, 0.0))) / (2 * qa)
+        eps_tr = EPSILON_CU * (d_mm - c_tr) / c_tr
+
+        # 3. Compression-controlled
+        delta_c = term_B ** 2 - 4 * term_A * (Mu_Nmm / PHI_COMPRESSION)
+        As_c = (-term_B - np.sqrt(np.maximum(delta_c, 0.0))) / (2 * term_A)
+        c_c = As_c * fy / (WHITNEY_COEFF * fc * b_mm) / beta1
+        eps_c = EPSILON_CU * (d_mm - c_c) / c_c
+
+    tension = (delta_t >= 0) & (eps_t >= EPSILON_T_TENSION)
+    transition = ~tension & (delta_t >= 0) & (disc >= 0) & (eps_tr > EPSILON_T_COMPRESSION)
+    compression = ~tension & ~transition
+
+    c = np.where(tension, c_t, np.where(transition, c_tr, c_c))
+    epsilon_t = np.where(tension, eps_t, np.where(transition, eps_tr, eps_c))
+    As_req = np.where(tension, As_t, np.where(transition, K * c_tr / fy, As_c))
+    phi = np.where(
+        tension,
+        PHI_TENSION,
+        np.where(transition, PHI_COMPRESSION + PHI_SLOPE * (eps_tr - EPSILON_T_COMPRESSION), PHI_COMPRESSION),
+    )
+    error = (delta_t < 0) | (compression & (delta_c < 0))
+    phi = np.where(delta_t < 0, PHI_TENSION, phi)
 
-    errors = validate_section_geometry(section)
-    if errors:
-        return FlexureResult(
-            status=f"Error: {' | '.join(errors)}",
-            status_code="error",
-            phi=PHI_COMPRESSION,
-        )
+    return _PhiBatch(error, As_req, beta1 * c, c, epsilon_t, phi)
 
-    Mu_norm, input_trace = normalize_load_with_policy(Mu, "Mu")
-    trace: list[TraceCheck] = []
-    if input_trace:
-        trace.append(input_trace)
 
-    Mu_Nmm = kNm_to_Nmm(Mu_norm)
-    b_mm = cm_to_mm(section.b)
-    d_mm = cm_to_mm(section.d)
-    fc = section.fc
-    fy = section.fy
-
-    As_min = _compute_As_min(fc, fy, b_mm, d_mm)
-    trace.append(
-        TraceCheck(
-            code_ref="ACI 318-19 Table 9.6.1.2",
-            formula_id="As_min",
-            inputs={"fc_MPa": fc, "fy_MPa": fy, "b_mm": b_mm, "d_mm": d_mm},
-            value=As_min,
-            units="mm2",
-            status="ok",
-        )
+def _as_min_trace(fc: float, fy: float, b_mm: float, d_mm: float, As_min: float) -> TraceCheck:
+    return TraceCheck(
+        code_ref="ACI 318-19 Table 9.6.1.2",
+        formula_id="As_min",
+        inputs=(fc, fy, b_mm, d_mm),
+        input_names=("fc_MPa", "fy_MPa", "b_mm", "d_mm"),
+        value=As_min,
+        units="mm2",
+        status="ok",
     )
 
+
+def _build_result(Mu_Nmm: float, b_mm: float, d_mm: float, As_min: float,
+                  result: _PhiResult | None, trace: list[TraceCheck],
+                  with_trace: bool = True) -> FlexureResult:
+    """Classify a solved phi state and package it into a FlexureResult."""
     # Negligible moment
-    if Mu_Nmm < 1e-6:
+    if result is None:
         return FlexureResult(
             As_calc=0.0,
             As_min=mm2_to_cm2(As_min),
@@ -141,66 +156,64 @@ def calculate_flexure(section: BeamSection, Mu: float) -> FlexureResult:
             phi=PHI_TENSION,
             epsilon_t=1.0,
             status="OK (Min Steel)",
-            status_code="ok",
+            status_code=Status.OK,
             c=0.0,
             a=0.0,
             trace=trace,
         )
 
-    result = _iterate_phi(section, Mu_Nmm, b_mm, d_mm, fc, fy)
-
-    if result["error"]:
-        trace.append(
-            TraceCheck(
-                code_ref="ACI 318-19 Section 22.2",
-                formula_id="phiMn_quadratic_discriminant",
-                inputs={"Mu_Nmm": Mu_Nmm},
-                value=result["phi"],
-                units="phi",
-                status="error",
-                note="Negative discriminant in flexure quadratic.",
+    if result.error:
+        if with_trace:
+            trace.append(
+                TraceCheck(
+                    code_ref="ACI 318-19 Section 22.2",
+                    formula_id="phiMn_quadratic_discriminant",
+                    inputs=(Mu_Nmm,),
+                    input_names=("Mu_Nmm",),
+                    value=result.phi,
+                    units="phi",
+                    status="error",
+                    note="Negative discriminant in flexure quadratic.",
+                )
             )
-        )
         return FlexureResult(
             As_calc=0.0,
             As_min=mm2_to_cm2(As_min),
             As_design=0.0,
             rho=0.0,
-            phi=result["phi"],
+            phi=result.phi,
             epsilon_t=0.0,
             status="Error: Section Overloaded (Compression Failure)",
-            status_code="error",
+            status_code=Status.ERROR,
             c=0.0,
             a=0.0,
             trace=trace,
         )
 
-    As_req = result["As_req"]
-    epsilon_t = result["epsilon_t"]
-    phi = result["phi"]
-    a = result["a"]
-    c = result["c"]
+    As_req, epsilon_t, phi, a, c = result.As_req, result.epsilon_t, result.phi, result.a, result.c
 
     status = "OK"
-    status_code = "ok"
+    status_code = Status.OK
     if epsilon_t < 0.004:
         status = "Warning: Low Ductility (epsilon_t < 0.004)"
-        status_code = "warning"
+        status_code = Status.WARNING
         logger.warning("Low ductility: epsilon_t=%.5f", epsilon_t)
     elif epsilon_t < EPSILON_T_TENSION:
         status = "Transition Zone (epsilon_t < 0.005)"
-        status_code = "warning"
-
-    trace.append(
-        TraceCheck(
-            code_ref="ACI 318-19 Section 21.2.2",
-            formula_id="phi_strain_classification",
-            inputs={"epsilon_t": epsilon_t},
-            value=phi,
-            units="phi",
-            status=status_code,
+        status_code = Status.WARNING
+
+    if with_trace:
+        trace.append(
+            TraceCheck(
+                code_ref="ACI 318-19 Section 21.2.2",
+                formula_id="phi_strain_classification",
+                inputs=(epsilon_t,),
+                input_names=("epsilon_t",),
+                value=phi,
+                units="phi",
+                status=status_code.label,
+            )
         )
-    )
 
     return FlexureResult(
         As_calc=mm2_to_cm2(As_req),
@@ -215,3 +228,206 @@ def calculate_flexure(section: BeamSection, Mu: float) -> FlexureResult:
         a=mm_to_cm(a),
         trace=trace,
     )
+
+
+def calculate_flexure(section: BeamSection, Mu: float, *, with_trace: bool = True) -> FlexureResult:
+    """
+    Calculate required reinforcement for a given ultimate moment.
+
+    Args:
+        section: The beam section object.
+        Mu: Ultimate Moment (kNm).
+        with_trace: Record ACI TraceCheck entries. Pass False when only the
+            summary fields are read; the returned trace is then empty.
+
+    Returns:
+        FlexureResult with As_calc, As_min, As_design, rho, phi, epsilon_t,
+        status, status_code, c, a and the calculation trace.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Flexure calc: Mu=%.2f kNm, b=%.1f h=%.1f", Mu, section.b, section.h)
+
+    errors = section.geometry_errors
+    if errors:
+        return FlexureResult(
+            status=f"Error: {' | '.join(errors)}",
+            status_code=Status.ERROR,
+            phi=PHI_COMPRESSION,
+        )
+
+    Mu_norm, input_trace = normalize_load_with_policy(Mu, "Mu")
+    trace: list[TraceCheck] = []
+    if input_trace and with_trace:
+        trace.append(input_trace)
+
+    Mu_Nmm = kNm_to_Nmm(Mu_norm)
+    b_mm = section.b_mm
+    d_mm = section.d_mm
+    fc = section.fc
+    fy = section.fy
+
+    As_min = _compute_As_min(section.sqrt_fc, fy, b_mm, d_mm)
+    if with_trace:
+        trace.append(_as_min_trace(fc, fy, b_mm, d_mm, As_min))
+
+    if Mu_Nmm < 1e-6:
+        return _build_result(Mu_Nmm, b_mm, d_mm, As_min, None, trace, with_trace)
+
+    result = _iterate_phi(section, Mu_Nmm, b_mm, d_mm, fc, fy)
+    return _build_result(Mu_Nmm, b_mm, d_mm, As_min, result, trace, with_trace)
+
+
+def min_steel_result(section: BeamSection, *, with_trace: bool = True) -> FlexureResult:
+    """
+    Result for a face with no design moment: minimum steel governs.
+
+    Equivalent to calculate_flexure(section, 0) without the load
+    normalization and phi solve.
+    """
+    errors = section.geometry_errors
+    if errors:
+        return FlexureResult(
+            status=f"Error: {' | '.join(errors)}",
+            status_code=Status.ERROR,
+            phi=PHI_COMPRESSION,
+        )
+
+    b_mm = section.b_mm
+    d_mm = section.d_mm
+    As_min = _compute_As_min(section.sqrt_fc, section.fy, b_mm, d_mm)
+    trace: list[TraceCheck] = []
+    if with_trace:
+        trace.append(_as_min_trace(section.fc, section.fy, b_mm, d_mm, As_min))
+    return _build_result(0.0, b_mm, d_mm, As_min, None, trace, with_trace)
+
+
+def calculate_flexure_batch(section: BeamSection, Mu: Sequence[float] | np.ndarray, *,
+                            with_trace: bool = True) -> list[FlexureResult]:
+    """
+    Calculate required reinforcement for several ultimate moments at once.
+
+    The quadratic/phi solve runs vectorized over all moments; each entry is
+    then packaged exactly as calculate_flexure would return it.
+
+    Args:
+        section: The beam section object.
+        Mu: Ultimate Moments (kNm).
+        with_trace: Record ACI TraceCheck entries for every result.
+
+    Returns:
+        One FlexureResult per moment, in input order.
+    """
+    Mu_arr = np.asarray(Mu, dtype=float).ravel()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Flexure batch: %d moments, b=%.1f h=%.1f", Mu_arr.size, section.b, section.h)
+
+    errors = section.geometry_errors
+    if errors:
+        return [
+            FlexureResult(status=f"Error: {' | '.join(errors)}", status_code=Status.ERROR, phi=PHI_COMPRESSION)
+            for _ in range(Mu_arr.size)
+        ]
+
+    b_mm = section.b_mm
+    d_mm = section.d_mm
+    fc = section.fc
+    fy = section.fy
+    As_min = _compute_As_min(section.sqrt_fc, fy, b_mm, d_mm)
+
+    Mu_Nmm = np.abs(Mu_arr) * NMM_PER_KNM
+    solved = _iterate_phi_batch(
+        Mu_Nmm, section.flex_term_A, section.flex_term_B, b_mm, d_mm, fc, fy, section.beta1
+    )
+
+    results: list[FlexureResult] = []
+    for i, mu in enumerate(Mu_arr.tolist()):
+        trace: list[TraceCheck] = []
+        if with_trace:
+            _, input_trace = normalize_load_with_policy(mu, "Mu")
+            if input_trace:
+                trace.append(input_trace)
+            trace.append(_as_min_trace(fc, fy, b_mm, d_mm, As_min))
+
+        if Mu_Nmm[i] < 1e-6:
+            results.append(_build_result(float(Mu_Nmm[i]), b_mm, d_mm, As_min, None, trace, with_trace))
+            continue
+
+        result = _PhiResult(
+            bool(solved.error[i]), float(solved.As_req[i]), float(solved.a[i]),
+            float(solved.c[i]), float(solved.epsilon_t[i]), float(solved.phi[i]),
+        )
+        if result.error:
+            logger.warning("Section overloaded: discriminant < 0 at phi=%.4f", result.phi)
+        results.append(_build_result(float(Mu_Nmm[i]), b_mm, d_mm, As_min, result, trace, with_trace))
+
+    return results
+
+
+def calculate_flexure_sweep(b: ArrayLike, h: ArrayLike, fc: ArrayLike, fy: ArrayLike,
+                            cover: ArrayLike, Mu: ArrayLike) -> dict[str, np.ndarray]:
+    """
+    Vectorized calculate_flexure over many sections/moments (parameter sweeps).
+
+    Inputs are broadcast against each other, one entry per design case,
+    in the units of BeamSection and calculate_flexure (cm, MPa, kNm). Unlike
+    calculate_flexure_batch, the section properties vary per entry; no
+    trace is produced.
+
+    Returns:
+        dict of arrays with the numeric FlexureResult fields: As_calc, As_min,
+        As_design, rho, phi, epsilon_t, c, a, plus status_code (Status values
+        as STATUS_CODE_DTYPE).
+    """
+    b_cm, h_cm, fc_arr, fy_arr, cover_cm, Mu_kNm = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (b, h, fc, fy, cover, Mu))
+    )
+    b_mm = b_cm * MM_PER_CM
+    h_mm = h_cm * MM_PER_CM
+    cover_mm = cover_cm * MM_PER_CM
+    d_mm = h_mm - cover_mm
+    Mu_Nmm = np.abs(Mu_kNm) * NMM_PER_KNM
+
+    # Same rules as validate_section_geometry
+    invalid = (
+        (b_mm <= 0) | (h_mm <= 0) | (cover_mm <= 0) | (d_mm <= 0)
+        | (cover_mm >= np.minimum(b_mm, h_mm) / 2)
+    )
+
+    # Same beta1 / quadratic coefficients as BeamSection
+    beta1 = np.where(
+        fc_arr <= FC_BETA1_UPPER,
+        BETA1_HIGH,
+        np.where(fc_arr < FC_BETA1_LOWER, BETA1_HIGH - 0.05 * (fc_arr - FC_BETA1_UPPER) / 7, BETA1_LOW),
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        term_A = fy_arr * fy_arr / (2 * WHITNEY_COEFF * fc_arr * b_mm)
+        bd = b_mm * d_mm
+        As_min = np.maximum(MIN_RHO_COEFF_1 * np.sqrt(fc_arr) / fy_arr, MIN_RHO_COEFF_2 / fy_arr) * bd
+    solved = _iterate_phi_batch(Mu_Nmm, term_A, -fy_arr * d_mm, b_mm, d_mm, fc_arr, fy_arr, beta1)
+
+    negligible = Mu_Nmm < 1e-6
+    designed = ~(negligible | solved.error | invalid)
+    As_calc = np.where(designed, solved.As_req, 0.0)
+    epsilon_t = np.where(designed, solved.epsilon_t, np.where(negligible & ~invalid, 1.0, 0.0))
+    phi = np.where(
+        invalid, PHI_COMPRESSION, np.where(negligible, PHI_TENSION, solved.phi)
+    )
+    failed = invalid | (solved.error & ~negligible)
+    status_code = np.where(
+        failed,
+        Status.ERROR,
+        np.where(designed & (solved.epsilon_t < EPSILON_T_TENSION), Status.WARNING, Status.OK),
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = np.where(designed, solved.As_req / bd, 0.0)
+    return {
+        "As_calc": As_calc / MM2_PER_CM2,
+        "As_min": np.where(invalid, 0.0, As_min) / MM2_PER_CM2,
+        "As_design": np.where(failed, 0.0, np.maximum(As_calc, As_min)) / MM2_PER_CM2,
+        "rho": rho,
+        "phi": phi,
+        "epsilon_t": epsilon_t,
+        "c": np.where(designed, solved.c, 0.0) / MM_PER_CM,
+        "a": np.where(designed, solved.a, 0.0) / MM_PER_CM,
+        "status_code": status_code.astype(STATUS_CODE_DTYPE),
+    }
@@ -2,19 +2,21 @@ from __future__ import annotations
 
 from typing import Any
 
+from src.models.result_types import Status
 
-def _state_from_status_code(status_code: str) -> str:
-    if status_code == "ok":
+
+def _state_from_status_code(status_code: Status) -> str:
+    if status_code == Status.OK:
         return "cumple"
-    if status_code == "warning":
+    if status_code == Status.WARNING:
         return "advertencia"
-    if status_code == "error":
+    if status_code == Status.ERROR:
         return "no cumple"
     return "pendiente"
 
 
 def _criterion_from_result(res: Any) -> str:
-    if res.status_code == "error":
+    if res.status_code == Status.ERROR:
         return "Sección sobrecargada"
     if res.As_design <= res.As_min + 1e-9:
         return "Gobierna acero mínimo"
@@ -51,7 +53,7 @@ def build_flexure_checklist(face_label: str, res: Any) -> list[dict[str, str]]:
         }
     )
 
-    if res.status_code == "error":
+    if res.status_code == Status.ERROR:
         ductility_state = "no cumple"
     elif res.epsilon_t < 0.004:
         ductility_state = "advertencia"
@@ -72,7 +74,7 @@ def build_flexure_checklist(face_label: str, res: Any) -> list[dict[str, str]]:
         }
     )
 
-    if res.status_code == "error":
+    if res.status_code == Status.ERROR:
         rows.append(
             {
                 "Cara": face_label,
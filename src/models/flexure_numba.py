@@ -0,0 +1,93 @@
+"""Compiled numeric kernel for the flexure phi solve."""
+
+from __future__ import annotations
+
+import math
+
+from src.models._jit import njit
+from src.models.aci_constants import (
+    EPSILON_CU,
+    EPSILON_T_COMPRESSION,
+    EPSILON_T_TENSION,
+    PHI_COMPRESSION,
+    PHI_TENSION,
+    WHITNEY_COEFF,
+)
+
+# Transition zone phi written in terms of the neutral axis depth:
+# phi = PHI_COMPRESSION + slope * (epsilon_t - EPSILON_T_COMPRESSION)
+#     = PHI_TRANSITION_P0 + PHI_TRANSITION_P1 * d / c,  with epsilon_t = EPSILON_CU * (d - c) / c
+PHI_SLOPE = (PHI_TENSION - PHI_COMPRESSION) / (EPSILON_T_TENSION - EPSILON_T_COMPRESSION)
+PHI_TRANSITION_P0 = PHI_COMPRESSION - PHI_SLOPE * (EPSILON_CU + EPSILON_T_COMPRESSION)
+PHI_TRANSITION_P1 = PHI_SLOPE * EPSILON_CU
+
+
+@njit("Tuple((b1, f8, f8, f8, f8, f8))(f8, f8, f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _iterate_phi_nb(Mu_Nmm: float, term_A: float, term_B: float, b_mm: float, d_mm: float,
+                    fc: float, fy: float, beta1: float) -> tuple[bool, float, float, float, float, float]:
+    """
+    Closed-form phi-consistent flexure solve on primitive floats.
+
+    term_A and term_B are the section's quadratic coefficients
+    (BeamSection.flex_term_A / flex_term_B):
+    term_A * As^2 + term_B * As + Mu/phi = 0.
+
+    The solution lies in one of three regimes, tried in order:
+    1. Tension-controlled: solve with phi = 0.9 and accept if epsilon_t >= 0.005.
+    2. Transition: substitute phi(c) = P0 + P1*d/c into phi*Mn(c) = Mu, a quadratic
+       in c whose smaller root is taken; accept if epsilon_t > 0.002.
+    3. Compression-controlled: solve with phi = 0.65.
+
+    Returns:
+        (err_flag, As_req, a, c, epsilon_t, phi). When err_flag is True the
+        quadratic discriminant is negative and only phi is meaningful.
+    """
+    # Local bindings: LOAD_FAST instead of LOAD_GLOBAL when running without Numba.
+    wc = WHITNEY_COEFF
+    eps_cu = EPSILON_CU
+    eps_t_lim = EPSILON_T_TENSION
+    eps_c_lim = EPSILON_T_COMPRESSION
+    phi_t = PHI_TENSION
+    phi_c = PHI_COMPRESSION
+    phi_slope = PHI_SLOPE
+    phi_p0 = PHI_TRANSITION_P0
+    phi_p1 = PHI_TRANSITION_P1
+
+    # 1. Tension-controlled
+    delta = term_B ** 2 - 4 * term_A * (Mu_Nmm / phi_t)
+    if delta < 0:
+        return True, 0.0, 0.0, 0.0, 0.0, phi_t
+
+    As_req = (-term_B - math.sqrt(delta)) / (2 * term_A)
+    a = As_req * fy / (wc * fc * b_mm)
+    c = a / beta1
+    epsilon_t = eps_cu * (d_mm - c) / c
+    if epsilon_t >= eps_t_lim:
+        return False, As_req, a, c, epsilon_t, phi_t
+
+    # 2. Transition: K*(P0*c + P1*d)*(d - beta1*c/2) = Mu, with K = 0.85*fc*b*beta1
+    K = wc * fc * b_mm * beta1
+    qa = -0.5 * K * phi_p0 * beta1
+    qb = K * d_mm * (phi_p0 - 0.5 * phi_p1 * beta1)
+    qc = K * phi_p1 * d_mm * d_mm - Mu_Nmm
+    disc = qb * qb - 4 * qa * qc
+    if disc >= 0:
+        c = (-qb + math.sqrt(disc)) / (2 * qa)
+        epsilon_t = eps_cu * (d_mm - c) / c
+        if epsilon_t > eps_c_lim:
+            phi = phi_c + phi_slope * (epsilon_t - eps_c_lim)
+            a = beta1 * c
+            As_req = K * c / fy
+            return False, As_req, a, c, epsilon_t, phi
+
+    # 3. Compression-controlled
+    delta = term_B ** 2 - 4 * term_A * (Mu_Nmm / phi_c)
+    if delta < 0:
+        return True, 0.0, 0.0, 0.0, 0.0, phi_c
+
+    As_req = (-term_B - math.sqrt(delta)) / (2 * term_A)
+    a = As_req * fy / (wc * fc * b_mm)
+    c = a / beta1
+    epsilon_t = eps_cu * (d_mm - c) / c
+    return False, As_req, a, c, epsilon_t, phi_c
+
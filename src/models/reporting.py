@@ -1,26 +1,35 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
-from src.models import flexure, shear, torsion
-from src.models.design_inputs import DesignInputs
+from src.models import flexure
+from src.models._compat import DATACLASS_SLOTS
+from src.models._json import dumps_indented
+from src.models.combined import calculate_shear_and_torsion
+from src.models.design_inputs import STIRRUP_BAR_DIAMETERS, DesignInputs
 from src.models.flexure_checklist import build_flexure_checklist, build_flexure_summary
+from src.models.result_types import Status
 from src.models.section import BeamSection
 from src.models.torsion_distribution import distribute_torsion_longitudinal_reinf
 
 
-@dataclass
+def _freeze_rows(rows: list[dict[str, Any]]) -> tuple[Mapping[str, Any], ...]:
+    return tuple(MappingProxyType(row) for row in rows)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ReportBundle:
     flexure_pos: Any
     flexure_neg: Any
     shear_res: Any
     torsion_res: Any
     torsion_dist: Any
-    flexure_checklist: list[dict[str, str]]
-    flexure_summary: list[dict[str, Any]]
-    warnings: list[str]
-    governing_criteria: list[dict[str, str]]
+    flexure_checklist: tuple[Mapping[str, str], ...]
+    flexure_summary: tuple[Mapping[str, Any], ...]
+    warnings: tuple[str, ...]
+    governing_criteria: tuple[Mapping[str, str], ...]
 
     def export_payload(self) -> dict[str, Any]:
         return {
@@ -29,19 +38,29 @@ class ReportBundle:
             "shear": self.shear_res.to_dict(),
             "torsion": self.torsion_res.to_dict(),
             "torsion_distribution": self.torsion_dist.to_dict(),
-            "flexure_checklist": self.flexure_checklist,
-            "flexure_summary": self.flexure_summary,
-            "warnings": self.warnings,
-            "governing_criteria": self.governing_criteria,
+            "flexure_checklist": [dict(row) for row in self.flexure_checklist],
+            "flexure_summary": [dict(row) for row in self.flexure_summary],
+            "warnings": list(self.warnings),
+            "governing_criteria": [dict(row) for row in self.governing_criteria],
         }
 
+    def export_json(self) -> bytes:
+        return dumps_indented(self.export_payload())
+
 
 def build_design_report(section: BeamSection, design_inputs: DesignInputs) -> ReportBundle:
-    res_flex_pos = flexure.calculate_flexure(section, design_inputs.mu_pos)
-    res_flex_neg = flexure.calculate_flexure(section, design_inputs.mu_neg)
-    stirrup_diameter = 0.95 if design_inputs.stirrup_bar.startswith("#3") else 1.27
-    res_shear = shear.calculate_shear(section, design_inputs.vu, design_inputs.n_legs, stirrup_diameter)
-    res_tors = torsion.calculate_torsion(section, design_inputs.tu, design_inputs.vu_torsion)
+    if design_inputs.mu_neg == 0.0:
+        res_flex_pos = flexure.calculate_flexure(section, design_inputs.mu_pos)
+        res_flex_neg = flexure.min_steel_result(section)
+    else:
+        res_flex_pos, res_flex_neg = flexure.calculate_flexure_batch(
+            section, [design_inputs.mu_pos, design_inputs.mu_neg]
+        )
+    stirrup_diameter = STIRRUP_BAR_DIAMETERS.get(design_inputs.stirrup_bar, 1.27)
+    res_shear, res_tors = calculate_shear_and_torsion(
+        section, design_inputs.vu, design_inputs.tu, design_inputs.n_legs, stirrup_diameter,
+        Vu_torsion=design_inputs.vu_torsion,
+    )
     dist = distribute_torsion_longitudinal_reinf(
         al_total=res_tors.Al_req,
         b_cm=section.b,
@@ -52,7 +71,7 @@ def build_design_report(section: BeamSection, design_inputs: DesignInputs) -> Re
 
     warnings: list[str] = []
     for item in (res_flex_pos, res_flex_neg, res_shear, res_tors):
-        if item.status_code in {"warning", "error"}:
+        if item.status_code != Status.OK:
             warnings.append(item.status)
 
     governing = [
@@ -76,8 +95,8 @@ def build_design_report(section: BeamSection, design_inputs: DesignInputs) -> Re
         shear_res=res_shear,
         torsion_res=res_tors,
         torsion_dist=dist,
-        flexure_checklist=flexure_checklist,
-        flexure_summary=flexure_summary,
-        warnings=warnings,
-        governing_criteria=governing,
+        flexure_checklist=_freeze_rows(flexure_checklist),
+        flexure_summary=_freeze_rows(flexure_summary),
+        warnings=tuple(warnings),
+        governing_criteria=_freeze_rows(governing),
     )
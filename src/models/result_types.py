@@ -1,37 +1,92 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from enum import IntEnum
 from typing import Any, Iterator
 
+from src.models._compat import DATACLASS_SLOTS
 
-@dataclass
+
+class Status(IntEnum):
+    """
+    Result status codes, ordered by severity.
+
+    The vectorized calculators (calculate_flexure_sweep,
+    calculate_shear_batch) return these values in a "status_code" array
+    of dtype STATUS_CODE_DTYPE. Serialized results carry the label instead.
+    """
+
+    OK = 0
+    WARNING = 1
+    ERROR = 2
+
+    @property
+    def label(self) -> str:
+        """Lower-case name ("ok", "warning", "error") for traces and exports."""
+        return self.name.lower()
+
+
+# dtype of the "status_code" arrays returned by the vectorized calculators
+STATUS_CODE_DTYPE = "int8"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TraceCheck:
     code_ref: str
     formula_id: str
-    inputs: dict[str, float]
+    inputs: tuple[float, ...]
     value: float
     units: str
     status: str
     note: str = ""
+    input_names: tuple[str, ...] = ()
+
+    @property
+    def inputs_dict(self) -> dict[str, float]:
+        """Inputs keyed by name, built on demand for reporting."""
+        return dict(zip(self.input_names, self.inputs))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "code_ref": self.code_ref,
+            "formula_id": self.formula_id,
+            "inputs": self.inputs_dict,
+            "value": self.value,
+            "units": self.units,
+            "status": self.status,
+            "note": self.note,
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ResultBase:
     status: str
-    status_code: str
+    status_code: Status
     trace: list[TraceCheck] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
         raise NotImplementedError
 
+    # Mapping access reads fields directly; only "trace" and "status_code"
+    # need the serialized form of to_dict(). The Status enum itself stays on
+    # the status_code attribute.
     def __getitem__(self, key: str) -> Any:
-        return self.to_dict()[key]
+        if key == "trace":
+            return self.to_dict()["trace"]
+        if key == "status_code":
+            return self.status_code.label
+        if key in self.__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
 
     def get(self, key: str, default: Any = None) -> Any:
-        return self.to_dict().get(key, default)
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
     def keys(self):
-        return self.to_dict().keys()
+        return self.__dataclass_fields__.keys()
 
     def items(self):
         return self.to_dict().items()
@@ -40,13 +95,13 @@ class ResultBase:
         return self.to_dict().values()
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self.to_dict())
+        return iter(self.__dataclass_fields__)
 
     def __len__(self) -> int:
-        return len(self.to_dict())
+        return len(self.__dataclass_fields__)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FlexureResult(ResultBase):
     As_calc: float = 0.0
     As_min: float = 0.0
@@ -66,14 +121,14 @@ class FlexureResult(ResultBase):
             "phi": self.phi,
             "epsilon_t": self.epsilon_t,
             "status": self.status,
-            "status_code": self.status_code,
+            "status_code": self.status_code.label,
             "c": self.c,
             "a": self.a,
-            "trace": [t.__dict__ for t in self.trace],
+            "trace": [t.as_dict() for t in self.trace],
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ShearResult(ResultBase):
     Vc: float = 0.0
     phi_Vc: float = 0.0
@@ -91,14 +146,14 @@ class ShearResult(ResultBase):
             "s_req": self.s_req,
             "s_max": self.s_max,
             "status": self.status,
-            "status_code": self.status_code,
+            "status_code": self.status_code.label,
             "Av": self.Av,
             "Av_bar_cm2": self.Av_bar_cm2,
-            "trace": [t.__dict__ for t in self.trace],
+            "trace": [t.as_dict() for t in self.trace],
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TorsionResult(ResultBase):
     Tu: float = 0.0
     T_th: float = 0.0
@@ -119,11 +174,11 @@ class TorsionResult(ResultBase):
             "T_cr": self.T_cr,
             "phi_T_cr": self.phi_T_cr,
             "status": self.status,
-            "status_code": self.status_code,
+            "status_code": self.status_code.label,
             "At_s_req": self.At_s_req,
             "At_s_req_cm2_m": self.At_s_req_cm2_m,
             "Al_req": self.Al_req,
             "check_cross_section": self.check_cross_section,
             "action": self.action,
-            "trace": [t.__dict__ for t in self.trace],
+            "trace": [t.as_dict() for t in self.trace],
         }
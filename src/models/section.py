@@ -1,9 +1,26 @@
 from __future__ import annotations
 
-from src.models.aci_constants import BETA1_HIGH, BETA1_LOW, FC_BETA1_LOWER, FC_BETA1_UPPER
+import math
+
+from src.models.aci_constants import (
+    BETA1_HIGH,
+    BETA1_LOW,
+    FC_BETA1_LOWER,
+    FC_BETA1_UPPER,
+    WHITNEY_COEFF,
+)
+from src.models.units import cm_to_mm
+from src.models.validation import validate_section_geometry
 
 
 class BeamSection:
+    __slots__ = (
+        "b", "h", "fc", "fy", "cover", "d", "sqrt_fc",
+        "b_mm", "h_mm", "cover_mm", "d_mm",
+        "Acp", "Pcp", "x1", "y1", "Aoh", "Ph",
+        "beta1", "flex_term_A", "flex_term_B", "geometry_errors",
+    )
+
     def __init__(self, b: float, h: float, fc: float, fy: float, cover: float) -> None:
         """
         Initialize the BeamSection with material and geometric properties.
@@ -29,6 +46,22 @@ class BeamSection:
         self.fy = fy
         self.cover = cover
         self.d = h - cover
+        self.sqrt_fc = math.sqrt(fc)
+
+        # Geometry in mm, shared by the flexure, shear and torsion calculations
+        self.b_mm = cm_to_mm(b)
+        self.h_mm = cm_to_mm(h)
+        self.cover_mm = cm_to_mm(cover)
+        self.d_mm = cm_to_mm(self.d)
+
+        # Torsion section properties (ACI 318-19 Section 22.7)
+        self.Acp = self.b_mm * self.h_mm
+        self.Pcp = 2 * (self.b_mm + self.h_mm)
+        self.x1 = self.b_mm - 2 * self.cover_mm
+        self.y1 = self.h_mm - 2 * self.cover_mm
+        stirrups_fit = self.x1 > 0 and self.y1 > 0
+        self.Aoh = self.x1 * self.y1 if stirrups_fit else 0
+        self.Ph = 2 * (self.x1 + self.y1) if stirrups_fit else 0
 
         # Beta1 calculation (ACI 318-19 Table 22.2.2.4.3)
         if fc <= FC_BETA1_UPPER:
@@ -37,3 +70,11 @@ class BeamSection:
             self.beta1 = BETA1_HIGH - 0.05 * (fc - FC_BETA1_UPPER) / 7
         else:
             self.beta1 = BETA1_LOW
+
+        # Flexure As equation coefficients: flex_term_A * As^2 + flex_term_B * As + Mu/phi = 0
+        self.flex_term_A = (fy ** 2) / (2 * WHITNEY_COEFF * fc * self.b_mm)
+        self.flex_term_B = -fy * self.d_mm
+
+        # Design-level geometry checks (e.g. cover vs. width) that do not raise;
+        # the calculators report them as an error result.
+        self.geometry_errors: tuple[str, ...] = tuple(validate_section_geometry(self))
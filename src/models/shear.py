@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import logging
 import math
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
 
 from src.models.aci_constants import (
     AV_MIN_COEFF_1,
     AV_MIN_COEFF_2,
     LAMBDA_NWC,
+    NO_STIRRUPS_COEFF,
     PHI_SHEAR,
     S_MAX_HEAVY,
     S_MAX_NORMAL,
@@ -15,9 +19,10 @@ from src.models.aci_constants import (
     VS_HALF_COEFF,
     VS_MAX_COEFF,
 )
-from src.models.result_types import ShearResult, TraceCheck
-from src.models.units import N_to_kN, cm_to_mm, kN_to_N, mm2_to_cm2, mm_to_cm
-from src.models.validation import normalize_load_with_policy, validate_section_geometry
+from src.models.result_types import STATUS_CODE_DTYPE, ShearResult, Status, TraceCheck
+from src.models.shear_kernels import SHEAR_NO_STIRRUPS, SHEAR_VS_OVER_MAX, _compute_Vc, _shear_core
+from src.models.units import MM2_PER_CM2, MM_PER_CM, N_PER_KN
+from src.models.validation import normalize_load_with_policy
 
 if TYPE_CHECKING:
     from src.models.section import BeamSection
@@ -25,45 +30,29 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def _compute_Vc(fc: float, b_mm: float, d_mm: float) -> float:
-    """Concrete shear capacity Vc (simplified method)."""
-    return VC_COEFF * LAMBDA_NWC * math.sqrt(fc) * b_mm * d_mm
+class ShearValues(NamedTuple):
+    """Numeric fields of ShearResult, as returned by calculate_shear_fast."""
+
+    Vc: float
+    phi_Vc: float
+    Vs_req: float
+    s_req: float | None
+    s_max: float | None
+    status_code: Status
+    Av: float
+    Av_bar_cm2: float
 
 
 def _compute_stirrup_area(stirrup_diameter_cm: float, n_legs: int) -> tuple[float, float]:
     """Compute stirrup bar area and total area for given legs."""
-    d_mm = cm_to_mm(stirrup_diameter_cm)
+    d_mm = stirrup_diameter_cm * MM_PER_CM
     Av_bar = math.pi * (d_mm / 2) ** 2
     Av = n_legs * Av_bar
     return Av_bar, Av
 
 
-def _compute_spacing(Av: float, fy: float, d_mm: float, Vs_req: float,
-                     fc: float, b_mm: float) -> tuple[float, float]:
-    """Compute required spacing and max spacing limit."""
-    # Calculate spacing from Vs
-    if Vs_req <= 0:
-        s_calc = 9999.0  # Min reinforcement governs
-    else:
-        s_calc = (Av * fy * d_mm) / Vs_req
-
-    # Max spacing limits (ACI 318 Table 9.7.6.2.2)
-    if Vs_req <= VS_HALF_COEFF * math.sqrt(fc) * b_mm * d_mm:
-        s_max_limit = min(d_mm / 2, S_MAX_NORMAL)
-    else:
-        s_max_limit = min(d_mm / 4, S_MAX_HEAVY)
-
-    # Min shear reinforcement spacing limits
-    s_min_1 = (Av * fy) / (AV_MIN_COEFF_1 * math.sqrt(fc) * b_mm)
-    s_min_2 = (Av * fy) / (AV_MIN_COEFF_2 * b_mm)
-    s_max_min_reinf = min(s_min_1, s_min_2)
-
-    s_final = min(s_calc, s_max_limit, s_max_min_reinf)
-    return s_final, s_max_limit
-
-
 def calculate_shear(section: BeamSection, Vu: float, n_legs: int = 2,
-                    stirrup_diameter: float = 0.95) -> ShearResult:
+                    stirrup_diameter: float = 0.95, *, with_trace: bool = True) -> ShearResult:
     """
     Calculate shear reinforcement (stirrups) per ACI 318-19 Simplified Method.
 
@@ -72,131 +61,253 @@ def calculate_shear(section: BeamSection, Vu: float, n_legs: int = 2,
         Vu: Ultimate Shear Force (kN).
         n_legs: Number of legs for stirrups (usually 2).
         stirrup_diameter: Diameter of stirrup bar (cm).
+        with_trace: Record ACI TraceCheck entries (empty trace when False).
 
     Returns:
-        dict with keys: Vc, phi_Vc, Vs_req, s_req, s_max, status, Av, Av_bar_cm2
+        ShearResult with Vc, phi_Vc, Vs_req, s_req, s_max, status,
+        status_code, Av, Av_bar_cm2 and the calculation trace.
     """
-    logger.info("Shear calc: Vu=%.2f kN, b=%.1f d=%.1f", Vu, section.b, section.d)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Shear calc: Vu=%.2f kN, b=%.1f d=%.1f", Vu, section.b, section.d)
 
-    errors = validate_section_geometry(section)
+    errors = section.geometry_errors
     if errors:
         return ShearResult(
             status=f"Error: {' | '.join(errors)}",
-            status_code="error",
+            status_code=Status.ERROR,
         )
 
+    Vc = _compute_Vc(float(section.sqrt_fc), float(section.b_mm), float(section.d_mm))
+    return _shear_result(section, Vu, n_legs, stirrup_diameter, Vc, with_trace)
+
+
+def _shear_result(section: BeamSection, Vu: float, n_legs: int, stirrup_diameter: float,
+                  Vc: float, with_trace: bool) -> ShearResult:
+    """calculate_shear for a validated section, with Vc (N) supplied by the caller."""
     Vu_norm, input_trace = normalize_load_with_policy(Vu, "Vu")
     trace: list[TraceCheck] = []
-    if input_trace:
+    if input_trace and with_trace:
         trace.append(input_trace)
 
-    Vu_N = kN_to_N(Vu_norm)
-    b_mm = cm_to_mm(section.b)
-    d_mm = cm_to_mm(section.d)
+    Vu_N = Vu_norm * N_PER_KN
+    b_mm = section.b_mm
+    d_mm = section.d_mm
     fc = section.fc
     fy = section.fy
-
-    Vc = _compute_Vc(fc, b_mm, d_mm)
-    phi_Vc = PHI_SHEAR * Vc
-    trace.append(
-        TraceCheck(
-            code_ref="ACI 318-19 Section 22.5",
-            formula_id="Vc_simplified",
-            inputs={"fc_MPa": fc, "bw_mm": b_mm, "d_mm": d_mm},
-            value=Vc,
-            units="N",
-            status="ok",
-        )
-    )
+    sqrt_fc = section.sqrt_fc
 
     Av_bar, Av = _compute_stirrup_area(stirrup_diameter, n_legs)
-
-    # No stirrups needed
-    if Vu_N <= 0.5 * phi_Vc:
+    code, Vs_req, Vs_max, s_final, s_max_limit = _shear_core(
+        float(sqrt_fc), float(fy), float(b_mm), float(d_mm), float(Vu_N), float(Av), Vc
+    )
+    phi_Vc = PHI_SHEAR * Vc
+    if with_trace:
         trace.append(
             TraceCheck(
-                code_ref="ACI 318-19 Section 9.6",
-                formula_id="Vu_threshold_no_stirrups",
-                inputs={"Vu_N": Vu_N, "phiVc_N": phi_Vc},
-                value=Vu_N / max(phi_Vc, 1e-9),
-                units="ratio",
+                code_ref="ACI 318-19 Section 22.5",
+                formula_id="Vc_simplified",
+                inputs=(fc, b_mm, d_mm),
+                input_names=("fc_MPa", "bw_mm", "d_mm"),
+                value=Vc,
+                units="N",
                 status="ok",
             )
         )
+
+    # No stirrups needed
+    if code == SHEAR_NO_STIRRUPS:
+        if with_trace:
+            trace.append(
+                TraceCheck(
+                    code_ref="ACI 318-19 Section 9.6",
+                    formula_id="Vu_threshold_no_stirrups",
+                    inputs=(Vu_N, phi_Vc),
+                    input_names=("Vu_N", "phiVc_N"),
+                    value=Vu_N / max(phi_Vc, 1e-9),
+                    units="ratio",
+                    status="ok",
+                )
+            )
         return ShearResult(
-            Vc=N_to_kN(Vc),
-            phi_Vc=N_to_kN(phi_Vc),
+            Vc=Vc / N_PER_KN,
+            phi_Vc=phi_Vc / N_PER_KN,
             Vs_req=0,
             s_req=None,
-            s_max=mm_to_cm(d_mm / 2),
+            s_max=d_mm / 2 / MM_PER_CM,
             status="No Shear Reinforcement Required (Vu < 0.5 * phi * Vc)",
-            status_code="ok",
+            status_code=Status.OK,
             Av=Av,
-            Av_bar_cm2=mm2_to_cm2(Av_bar),
+            Av_bar_cm2=Av_bar / MM2_PER_CM2,
             trace=trace,
         )
 
-    # Required Vs
-    Vs_req = (Vu_N / PHI_SHEAR) - Vc
-
-    # Check max Vs
-    Vs_max = VS_MAX_COEFF * math.sqrt(fc) * b_mm * d_mm
-    trace.append(
-        TraceCheck(
-            code_ref="ACI 318-19 Section 22.5",
-            formula_id="Vs_max",
-            inputs={"fc_MPa": fc, "bw_mm": b_mm, "d_mm": d_mm},
-            value=Vs_max,
-            units="N",
-            status="ok",
-        )
-    )
-    if Vs_req > Vs_max:
-        logger.warning("Section too small for shear: Vs_req=%.0f > Vs_max=%.0f", Vs_req, Vs_max)
+    if with_trace:
         trace.append(
             TraceCheck(
                 code_ref="ACI 318-19 Section 22.5",
-                formula_id="Vs_req_gt_Vs_max",
-                inputs={"Vs_req_N": Vs_req, "Vs_max_N": Vs_max},
-                value=Vs_req,
+                formula_id="Vs_max",
+                inputs=(fc, b_mm, d_mm),
+                input_names=("fc_MPa", "bw_mm", "d_mm"),
+                value=Vs_max,
                 units="N",
-                status="error",
+                status="ok",
             )
         )
+    if code == SHEAR_VS_OVER_MAX:
+        logger.warning("Section too small for shear: Vs_req=%.0f > Vs_max=%.0f", Vs_req, Vs_max)
+        if with_trace:
+            trace.append(
+                TraceCheck(
+                    code_ref="ACI 318-19 Section 22.5",
+                    formula_id="Vs_req_gt_Vs_max",
+                    inputs=(Vs_req, Vs_max),
+                    input_names=("Vs_req_N", "Vs_max_N"),
+                    value=Vs_req,
+                    units="N",
+                    status="error",
+                )
+            )
         return ShearResult(
-            Vc=N_to_kN(Vc),
-            phi_Vc=N_to_kN(phi_Vc),
-            Vs_req=N_to_kN(Vs_req),
+            Vc=Vc / N_PER_KN,
+            phi_Vc=phi_Vc / N_PER_KN,
+            Vs_req=Vs_req / N_PER_KN,
             s_req=None,
             s_max=None,
             status="Error: Section Dimensions too small for Shear (Vs > Vs_max). Increase Dimensions.",
-            status_code="error",
+            status_code=Status.ERROR,
             Av=Av,
-            Av_bar_cm2=mm2_to_cm2(Av_bar),
+            Av_bar_cm2=Av_bar / MM2_PER_CM2,
             trace=trace,
         )
 
-    s_final, s_max_limit = _compute_spacing(Av, fy, d_mm, Vs_req, fc, b_mm)
-
-    trace.append(
-        TraceCheck(
-            code_ref="ACI 318-19 Table 9.7.6.2.2",
-            formula_id="stirrup_spacing",
-            inputs={"Av_mm2": Av, "fy_MPa": fy, "d_mm": d_mm, "Vs_req_N": Vs_req},
-            value=s_final,
-            units="mm",
-            status="ok",
+    if with_trace:
+        trace.append(
+            TraceCheck(
+                code_ref="ACI 318-19 Table 9.7.6.2.2",
+                formula_id="stirrup_spacing",
+                inputs=(Av, fy, d_mm, Vs_req),
+                input_names=("Av_mm2", "fy_MPa", "d_mm", "Vs_req_N"),
+                value=s_final,
+                units="mm",
+                status="ok",
+            )
         )
-    )
     return ShearResult(
-        Vc=N_to_kN(Vc),
-        phi_Vc=N_to_kN(phi_Vc),
-        Vs_req=N_to_kN(max(0, Vs_req)),
-        s_req=mm_to_cm(s_final),
-        s_max=mm_to_cm(s_max_limit),
+        Vc=Vc / N_PER_KN,
+        phi_Vc=phi_Vc / N_PER_KN,
+        Vs_req=max(0, Vs_req) / N_PER_KN,
+        s_req=s_final / MM_PER_CM,
+        s_max=s_max_limit / MM_PER_CM,
         status="Add Stirrups" if Vs_req > 0 else "Minimum Stirrups Required",
-        status_code="ok",
+        status_code=Status.OK,
         Av=Av,
-        Av_bar_cm2=mm2_to_cm2(Av_bar),
+        Av_bar_cm2=Av_bar / MM2_PER_CM2,
         trace=trace,
     )
+
+
+def calculate_shear_fast(section: BeamSection, Vu: float, n_legs: int = 2,
+                         stirrup_diameter: float = 0.95) -> ShearValues:
+    """
+    Numbers-only calculate_shear for optimizers and parameter sweeps.
+
+    Same kernel and results as calculate_shear, without logging, input
+    normalization traces, TraceCheck entries or status text.
+
+    Returns:
+        ShearValues(Vc, phi_Vc, Vs_req, s_req, s_max, status_code, Av, Av_bar_cm2).
+    """
+    if section.geometry_errors:
+        return ShearValues(0.0, 0.0, 0.0, None, None, Status.ERROR, 0.0, 0.0)
+
+    sqrt_fc = float(section.sqrt_fc)
+    b_mm = float(section.b_mm)
+    d_mm = float(section.d_mm)
+    Av_bar, Av = _compute_stirrup_area(stirrup_diameter, n_legs)
+    Vc = _compute_Vc(sqrt_fc, b_mm, d_mm)
+    code, Vs_req, _, s_final, s_max_limit = _shear_core(
+        sqrt_fc, float(section.fy), b_mm, d_mm, float(abs(Vu) * N_PER_KN), float(Av), Vc
+    )
+    Vc_kN = Vc / N_PER_KN
+    phi_Vc_kN = PHI_SHEAR * Vc / N_PER_KN
+    Av_bar_cm2 = Av_bar / MM2_PER_CM2
+    if code == SHEAR_NO_STIRRUPS:
+        return ShearValues(Vc_kN, phi_Vc_kN, 0.0, None, d_mm / 2 / MM_PER_CM, Status.OK, Av, Av_bar_cm2)
+    if code == SHEAR_VS_OVER_MAX:
+        return ShearValues(Vc_kN, phi_Vc_kN, Vs_req / N_PER_KN, None, None, Status.ERROR, Av, Av_bar_cm2)
+    return ShearValues(
+        Vc_kN, phi_Vc_kN, max(0, Vs_req) / N_PER_KN, s_final / MM_PER_CM, s_max_limit / MM_PER_CM,
+        Status.OK, Av, Av_bar_cm2,
+    )
+
+
+def calculate_shear_batch(b: ArrayLike, h: ArrayLike, fc: ArrayLike, fy: ArrayLike, cover: ArrayLike,
+                          Vu: ArrayLike, n_legs: int = 2,
+                          stirrup_diameter: float = 0.95) -> dict[str, np.ndarray]:
+    """
+    Vectorized calculate_shear over many sections/loads (parameter sweeps).
+
+    Inputs are broadcast against each other, one entry per design case,
+    in the units of BeamSection and calculate_shear (cm, MPa, kN). The
+    branches of calculate_shear are evaluated with np.where; no trace is
+    produced.
+
+    Returns:
+        dict of arrays with the numeric ShearResult fields: Vc, phi_Vc,
+        Vs_req, s_req, s_max (NaN where calculate_shear returns None),
+        Av, Av_bar_cm2, plus status_code (Status values as STATUS_CODE_DTYPE:
+        OK or ERROR).
+    """
+    b_cm, h_cm, fc_arr, fy_arr, cover_cm, Vu_kN = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (b, h, fc, fy, cover, Vu))
+    )
+    b_mm = b_cm * MM_PER_CM
+    h_mm = h_cm * MM_PER_CM
+    cover_mm = cover_cm * MM_PER_CM
+    d_mm = h_mm - cover_mm
+    Vu_N = np.abs(Vu_kN) * N_PER_KN
+
+    # Same rules as validate_section_geometry
+    invalid = (
+        (b_mm <= 0) | (h_mm <= 0) | (cover_mm <= 0) | (d_mm <= 0)
+        | (cover_mm >= np.minimum(b_mm, h_mm) / 2)
+    )
+
+    sqrt_fc = np.sqrt(fc_arr)
+    bd = b_mm * d_mm
+    sqrt_fc_bd = sqrt_fc * bd
+    Vc = VC_COEFF * LAMBDA_NWC * sqrt_fc_bd
+    phi_Vc = PHI_SHEAR * Vc
+    Av_bar, Av = _compute_stirrup_area(stirrup_diameter, n_legs)
+
+    no_stirrups = Vu_N <= NO_STIRRUPS_COEFF * sqrt_fc_bd
+    Vs_req = Vu_N / PHI_SHEAR - Vc
+    over_max = ~no_stirrups & (Vs_req > VS_MAX_COEFF * sqrt_fc_bd)
+    designed = ~(no_stirrups | over_max | invalid)
+
+    s_max_limit = np.where(
+        Vs_req <= VS_HALF_COEFF * sqrt_fc_bd,
+        np.minimum(d_mm / 2, S_MAX_NORMAL),
+        np.minimum(d_mm / 4, S_MAX_HEAVY),
+    )
+    Av_fy = Av * fy_arr
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s_final = np.fmin.reduce([
+            (Av_fy * d_mm) / np.maximum(Vs_req, 1e-9),
+            s_max_limit,
+            Av_fy / (AV_MIN_COEFF_1 * sqrt_fc * b_mm),
+            Av_fy / (AV_MIN_COEFF_2 * b_mm),
+        ])
+
+    Vs_out = np.where(over_max, Vs_req, np.maximum(Vs_req, 0.0))
+    s_max_out = np.where(designed, s_max_limit, np.where(no_stirrups & ~invalid, d_mm / 2, np.nan))
+    return {
+        "Vc": np.where(invalid, 0.0, Vc / N_PER_KN),
+        "phi_Vc": np.where(invalid, 0.0, phi_Vc / N_PER_KN),
+        "Vs_req": np.where(no_stirrups | invalid, 0.0, Vs_out / N_PER_KN),
+        "s_req": np.where(designed, s_final / MM_PER_CM, np.nan),
+        "s_max": s_max_out / MM_PER_CM,
+        "Av": np.where(invalid, 0.0, Av),
+        "Av_bar_cm2": np.where(invalid, 0.0, Av_bar / MM2_PER_CM2),
+        "status_code": np.where(invalid | over_max, Status.ERROR, Status.OK).astype(STATUS_CODE_DTYPE),
+    }
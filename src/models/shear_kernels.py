@@ -0,0 +1,77 @@
+"""Compiled numeric kernels for the shear design."""
+
+from __future__ import annotations
+
+from src.models._jit import njit
+from src.models.aci_constants import (
+    AV_MIN_COEFF_1,
+    AV_MIN_COEFF_2,
+    LAMBDA_NWC,
+    NO_STIRRUPS_COEFF,
+    PHI_SHEAR,
+    S_MAX_HEAVY,
+    S_MAX_NORMAL,
+    VC_COEFF,
+    VS_HALF_COEFF,
+    VS_MAX_COEFF,
+)
+
+# _shear_core outcome codes
+SHEAR_NO_STIRRUPS = 0
+SHEAR_OK = 1
+SHEAR_VS_OVER_MAX = 2
+
+
+# Explicit signatures compile eagerly at import (or load from the on-disk
+# cache) instead of on the first design request.
+@njit("f8(f8, f8, f8)", cache=True, fastmath=True)
+def _compute_Vc(sqrt_fc: float, b_mm: float, d_mm: float) -> float:
+    """Concrete shear capacity Vc (simplified method)."""
+    return VC_COEFF * LAMBDA_NWC * sqrt_fc * b_mm * d_mm
+
+
+@njit("UniTuple(f8, 2)(f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _compute_spacing(Av: float, fy: float, d_mm: float, Vs_req: float,
+                     sqrt_fc: float, b_mm: float) -> tuple[float, float]:
+    """Compute required spacing and max spacing limit."""
+    # Max spacing limits (ACI 318 Table 9.7.6.2.2)
+    if Vs_req <= VS_HALF_COEFF * sqrt_fc * b_mm * d_mm:
+        s_max_limit = min(d_mm / 2, S_MAX_NORMAL)
+    else:
+        s_max_limit = min(d_mm / 4, S_MAX_HEAVY)
+
+    # Spacing from Vs, capped by the max spacing and the minimum shear
+    # reinforcement limits. The clipped denominator makes s_calc huge when
+    # Vs_req <= 0, so min reinforcement governs without a separate branch.
+    Av_fy = Av * fy
+    s_final = min(
+        (Av_fy * d_mm) / max(Vs_req, 1e-9),
+        s_max_limit,
+        Av_fy / (AV_MIN_COEFF_1 * sqrt_fc * b_mm),
+        Av_fy / (AV_MIN_COEFF_2 * b_mm),
+    )
+    return s_final, s_max_limit
+
+
+@njit("Tuple((i8, f8, f8, f8, f8))(f8, f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _shear_core(sqrt_fc: float, fy: float, b_mm: float, d_mm: float,
+                Vu_N: float, Av: float, Vc: float) -> tuple[int, float, float, float, float]:
+    """
+    Full numeric shear pipeline on primitive floats, given Vc from _compute_Vc.
+
+    Returns:
+        (code, Vs_req, Vs_max, s_final, s_max_limit) in N and mm, where
+        code is SHEAR_NO_STIRRUPS (Vu <= 0.5*phi*Vc; nothing else is meaningful),
+        SHEAR_VS_OVER_MAX (section too small; spacings are 0) or SHEAR_OK.
+    """
+    sqrt_fc_bd = sqrt_fc * b_mm * d_mm
+    if Vu_N <= NO_STIRRUPS_COEFF * sqrt_fc_bd:
+        return SHEAR_NO_STIRRUPS, 0.0, 0.0, 0.0, 0.0
+
+    Vs_req = (Vu_N / PHI_SHEAR) - Vc
+    Vs_max = VS_MAX_COEFF * sqrt_fc_bd
+    if Vs_req > Vs_max:
+        return SHEAR_VS_OVER_MAX, Vs_req, Vs_max, 0.0, 0.0
+
+    s_final, s_max_limit = _compute_spacing(Av, fy, d_mm, Vs_req, sqrt_fc, b_mm)
+    return SHEAR_OK, Vs_req, Vs_max, s_final, s_max_limit
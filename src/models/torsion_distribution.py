@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
+from src.models._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TorsionLongitudinalDistribution:
     al_total: float
     n_bars: int
@@ -29,6 +32,8 @@ class TorsionLongitudinalDistribution:
         }
 
 
+# Results are frozen, so repeated reruns with the same inputs can share one instance
+@lru_cache(maxsize=256)
 def distribute_torsion_longitudinal_reinf(
     al_total: float,
     b_cm: float,
@@ -45,18 +50,14 @@ def distribute_torsion_longitudinal_reinf(
     h_inner = max(h_cm - 2 * cover_cm, 0.0)
     ph = max(2 * (b_inner + h_inner), 1e-9)
 
-    n_bottom = max(2, round(n_bars * b_inner / ph))
-    n_top = max(2, round(n_bars * b_inner / ph))
-    n_sides = n_bars - n_bottom - n_top
-    if n_sides < 0:
-        n_sides = 0
-        n_bottom = n_bars // 2
-        n_top = n_bars - n_bottom
-
-    if n_sides % 2 != 0:
-        n_bottom += 1
-        n_sides -= 1
-    n_side_each = max(0, n_sides // 2)
+    # Bars per horizontal face, capped so the two faces never exceed n_bars
+    n_face = max(2, round(n_bars * b_inner / ph))
+    capped = n_face > n_bars // 2
+    n_face = min(n_face, n_bars // 2)
+    n_side_each, n_odd = divmod(n_bars - 2 * n_face, 2)
+    # An odd leftover bar goes to the bottom face, or to the top one when capped
+    n_bottom = n_face + n_odd * (not capped)
+    n_top = n_face + n_odd * capped
 
     al_per_bar = al_total / n_bars
     al_bottom = n_bottom * al_per_bar
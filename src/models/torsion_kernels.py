@@ -0,0 +1,102 @@
+"""Compiled numeric kernels for the torsion design."""
+
+from __future__ import annotations
+
+import math
+
+from src.models._jit import njit
+from src.models.aci_constants import (
+    AL_MIN_COEFF,
+    AO_FACTOR,
+    CROSS_SECTION_COEFF,
+    LAMBDA_NWC,
+    PHI_T_CR_COEFF,
+    PHI_T_TH_COEFF,
+    PHI_TORSION,
+    T_CR_COEFF,
+    T_TH_COEFF,
+    TORSION_STRESS_COEFF,
+)
+
+# _torsion_core outcome codes
+TORSION_NEGLECTABLE = 0
+TORSION_REQUIRED = 1
+TORSION_SECTION_INADEQUATE = 2
+TORSION_AOH_INVALID = 3
+
+
+@njit("UniTuple(f8, 2)(f8, f8, f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _check_cross_section(Vu_N: float, Tu_Nmm: float, b_mm: float, d_mm: float,
+                         sqrt_fc: float, Ph: float, Aoh: float, Vc: float) -> tuple[float, float]:
+    """Combined stress and its limit for cross-sectional adequacy, ACI 318-19 22.7.7.1 (MPa)."""
+    bw_d = b_mm * d_mm
+    lhs_v = Vu_N / bw_d
+    lhs_t = (Tu_Nmm * Ph) / (TORSION_STRESS_COEFF * Aoh * Aoh)
+    lhs = math.hypot(lhs_v, lhs_t)
+
+    rhs_max = PHI_TORSION * ((Vc / bw_d) + CROSS_SECTION_COEFF * sqrt_fc)
+    return lhs, rhs_max
+
+
+@njit("f8(f8, f8, f8)", cache=True, fastmath=True)
+def _compute_transverse_reinf(Tu_Nmm: float, Aoh: float, fy: float) -> float:
+    """Compute At/s (transverse torsion reinforcement per unit length)."""
+    Tn = Tu_Nmm / PHI_TORSION
+    Ao = AO_FACTOR * Aoh
+    cot_theta = 1.0  # cot(45 degrees)
+    return Tn / (2 * Ao * fy * cot_theta)  # mm2/mm per leg
+
+
+@njit("f8(f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _compute_longitudinal_reinf(At_s_req: float, Ph: float, fy: float,
+                                sqrt_fc: float, Acp: float) -> float:
+    """
+    Compute Al (longitudinal torsion reinforcement).
+
+    With fyt = fy and cot(theta) = 1, Al = (At/s)*Ph*(fyt/fy)*cot^2(theta)
+    reduces to (At/s)*Ph.
+    """
+    Al_req = At_s_req * Ph
+
+    # ACI 318-19 Eq 9.6.4.3(a): Al,min = (5*sqrt(f'c)*Acp/fy) - (At/s)*Ph*(fyt/fy)
+    # Coefficient 5 is for psi units; for MPa: 5/12 = 0.42
+    Al_min = (AL_MIN_COEFF * sqrt_fc * Acp) / fy - Al_req
+
+    return max(Al_req, Al_min)
+
+
+@njit("Tuple((i8, f8, f8, f8, f8, f8, f8, f8, f8))(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)",
+      cache=True, fastmath=True)
+def _torsion_core(Tu_Nmm: float, Vu_N: float, sqrt_fc: float, fy: float, b_mm: float, d_mm: float,
+                  Acp: float, Pcp: float, Aoh: float, Ph: float,
+                  Vc: float) -> tuple[int, float, float, float, float, float, float, float, float]:
+    """
+    Numeric torsion pipeline on primitive floats (N, mm, MPa), given Vc from _compute_Vc.
+
+    Returns:
+        (code, T_th, T_cr, phi_T_th, phi_T_cr, lhs, rhs_max, At_s_req, Al_final),
+        where code is TORSION_AOH_INVALID (cover leaves no stirrup core; all values 0),
+        TORSION_NEGLECTABLE (only the T_th/T_cr values are meaningful),
+        TORSION_SECTION_INADEQUATE (At_s_req/Al_final are 0) or TORSION_REQUIRED.
+    """
+    # x1 <= 0 or y1 <= 0 shows up as Aoh <= 0 (one side) or Ph <= 0 (both sides)
+    if Aoh <= 0.0 or Ph <= 0.0:
+        return TORSION_AOH_INVALID, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0
+
+    # Threshold and cracking torsion
+    torsion_factor = LAMBDA_NWC * sqrt_fc * (Acp * Acp / Pcp)
+    T_th = T_TH_COEFF * torsion_factor
+    T_cr = T_CR_COEFF * torsion_factor
+    phi_T_th = PHI_T_TH_COEFF * torsion_factor
+    phi_T_cr = PHI_T_CR_COEFF * torsion_factor
+
+    if Tu_Nmm < phi_T_th:
+        return TORSION_NEGLECTABLE, T_th, T_cr, phi_T_th, phi_T_cr, 0.0, 0.0, 0.0, 0.0
+
+    lhs, rhs_max = _check_cross_section(Vu_N, Tu_Nmm, b_mm, d_mm, sqrt_fc, Ph, Aoh, Vc)
+    if lhs > rhs_max:
+        return TORSION_SECTION_INADEQUATE, T_th, T_cr, phi_T_th, phi_T_cr, lhs, rhs_max, 0.0, 0.0
+
+    At_s_req = _compute_transverse_reinf(Tu_Nmm, Aoh, fy)
+    Al_final = _compute_longitudinal_reinf(At_s_req, Ph, fy, sqrt_fc, Acp)
+    return TORSION_REQUIRED, T_th, T_cr, phi_T_th, phi_T_cr, lhs, rhs_max, At_s_req, Al_final
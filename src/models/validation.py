@@ -44,7 +44,8 @@ def normalize_load_with_policy(
     trace = TraceCheck(
         code_ref="Input Policy",
         formula_id=f"{load_name}_SIGN_NORMALIZATION",
-        inputs={"raw_input": value},
+        inputs=(value,),
+        input_names=("raw_input",),
         value=normalized,
         units="same_as_input",
         status="warning",
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from dataclasses import astuple
+from typing import Sequence, cast
+
+import pandas as pd
+import streamlit as st
+from matplotlib.figure import Figure
+
+from src.models import flexure, shear, torsion
+from src.models.design_inputs import DesignInputs
+from src.models.reporting import ReportBundle, build_design_report
+from src.models.result_types import FlexureResult, ShearResult, TorsionResult
+from src.models.section import BeamSection
+from src.ui import plotting
+
+
+def _section_key(section: BeamSection) -> tuple[float, float, float, float, float]:
+    return (section.b, section.h, section.fc, section.fy, section.cover)
+
+
+@st.cache_resource(show_spinner=False)
+def get_section(b: float, h: float, fc: float, fy: float, cover: float) -> BeamSection:
+    """Shared BeamSection per geometry/material set, reused across reruns."""
+    return BeamSection(b, h, fc, fy, cover)
+
+
+@st.cache_data(show_spinner=False)
+def _flexure_batch(b: float, h: float, fc: float, fy: float, cover: float,
+                   Mu: tuple[float, ...]) -> list[FlexureResult]:
+    return flexure.calculate_flexure_batch(get_section(b, h, fc, fy, cover), Mu, with_trace=False)
+
+
+@st.cache_data(show_spinner=False)
+def _shear(b: float, h: float, fc: float, fy: float, cover: float,
+           Vu: float, n_legs: int, stirrup_diameter: float) -> ShearResult:
+    return shear.calculate_shear(
+        get_section(b, h, fc, fy, cover), Vu, n_legs, stirrup_diameter, with_trace=False
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _torsion(b: float, h: float, fc: float, fy: float, cover: float, Tu: float, Vu: float) -> TorsionResult:
+    return torsion.calculate_torsion(get_section(b, h, fc, fy, cover), Tu, Vu, with_trace=False)
+
+
+def calculate_flexure_batch(section: BeamSection, Mu: Sequence[float]) -> list[FlexureResult]:
+    """Cached, untraced flexure.calculate_flexure_batch keyed on the section inputs and moments."""
+    return _flexure_batch(*_section_key(section), tuple(float(m) for m in Mu))
+
+
+def calculate_shear(section: BeamSection, Vu: float, n_legs: int = 2,
+                    stirrup_diameter: float = 0.95) -> ShearResult:
+    """Cached, untraced shear.calculate_shear keyed on the section inputs and loads."""
+    return _shear(*_section_key(section), Vu, n_legs, stirrup_diameter)
+
+
+def calculate_torsion(section: BeamSection, Tu: float, Vu: float) -> TorsionResult:
+    """Cached, untraced torsion.calculate_torsion keyed on the section inputs and loads."""
+    return _torsion(*_section_key(section), Tu, Vu)
+
+
+# The bundle holds read-only row mappings, which cannot be pickled for
+# st.cache_data; it is frozen, so one shared instance per key is safe.
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _design_report(b: float, h: float, fc: float, fy: float, cover: float,
+                   inputs: tuple) -> ReportBundle:
+    return build_design_report(get_section(b, h, fc, fy, cover), DesignInputs(*inputs))
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _report_json(b: float, h: float, fc: float, fy: float, cover: float, inputs: tuple) -> bytes:
+    return _design_report(b, h, fc, fy, cover, inputs).export_json()
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _criteria_csv(b: float, h: float, fc: float, fy: float, cover: float, inputs: tuple) -> bytes:
+    bundle = _design_report(b, h, fc, fy, cover, inputs)
+    csv = cast(str, pd.DataFrame(bundle.governing_criteria).to_csv(index=False))
+    return csv.encode("utf-8")
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _flexure_summary_df(b: float, h: float, fc: float, fy: float, cover: float, inputs: tuple,
+                        columns: tuple[str, ...]) -> pd.DataFrame:
+    bundle = _design_report(b, h, fc, fy, cover, inputs)
+    return pd.DataFrame.from_records(list(bundle.flexure_summary), columns=list(columns))
+
+
+def build_report(section: BeamSection, design_inputs: DesignInputs) -> ReportBundle:
+    """Cached reporting.build_design_report keyed on the section inputs and design inputs."""
+    return _design_report(*_section_key(section), astuple(design_inputs))
+
+
+def report_json(section: BeamSection, design_inputs: DesignInputs) -> bytes:
+    """Cached ReportBundle.export_json for the same key as build_report."""
+    return _report_json(*_section_key(section), astuple(design_inputs))
+
+
+def criteria_csv(section: BeamSection, design_inputs: DesignInputs) -> bytes:
+    """Cached CSV of the report's governing criteria for the same key as build_report."""
+    return _criteria_csv(*_section_key(section), astuple(design_inputs))
+
+
+def flexure_summary_df(section: BeamSection, design_inputs: DesignInputs,
+                       columns: tuple[str, ...]) -> pd.DataFrame:
+    """Cached DataFrame of the report's flexure summary rows, restricted to columns."""
+    return _flexure_summary_df(*_section_key(section), astuple(design_inputs), columns)
+
+
+# Figures: keyed on drawing inputs rounded to 0.01 so float jitter between
+# reruns does not miss the cache. plotting builds figures outside pyplot, so
+# evicted figures are freed without an explicit plt.close.
+def _r(x: float) -> float:
+    return round(float(x), 2)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _flexure_figure(b: float, h: float, cover: float, as_bot: float, as_top: float) -> Figure:
+    return cast(Figure, plotting.draw_beam_section_flexure(b, h, cover, as_bot, as_top))
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _shear_figure(b: float, h: float, cover: float, s_req: float | None, n_legs: int) -> Figure:
+    return cast(Figure, plotting.draw_beam_section_shear(b, h, cover, s_req, n_legs))
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _torsion_figure(b: float, h: float, cover: float, al_total: float, n_long_bars: int) -> Figure:
+    return cast(Figure, plotting.draw_beam_section_torsion(b, h, cover, al_total, n_long_bars))
+
+
+def draw_beam_section_flexure(b: float, h: float, cover: float, as_bot: float, as_top: float) -> Figure:
+    """Cached plotting.draw_beam_section_flexure."""
+    return _flexure_figure(_r(b), _r(h), _r(cover), _r(as_bot), _r(as_top))
+
+
+def draw_beam_section_shear(b: float, h: float, cover: float, s_req: float | None, n_legs: int) -> Figure:
+    """Cached plotting.draw_beam_section_shear."""
+    return _shear_figure(_r(b), _r(h), _r(cover), None if s_req is None else _r(s_req), int(n_legs))
+
+
+def draw_beam_section_torsion(b: float, h: float, cover: float, al_total: float,
+                              n_long_bars: int = 6) -> Figure:
+    """Cached plotting.draw_beam_section_torsion."""
+    return _torsion_figure(_r(b), _r(h), _r(cover), _r(al_total), int(n_long_bars))
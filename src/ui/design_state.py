@@ -4,6 +4,29 @@ from typing import Any
 
 from src.models.design_inputs import DesignInputs
 
+_DEFAULTS = DesignInputs().to_dict()
+_COERCE = {
+    "mu_pos": float,
+    "mu_neg": float,
+    "vu": float,
+    "tu": float,
+    "vu_torsion": float,
+    "n_legs": int,
+    "stirrup_bar": str,
+    "n_bars_torsion": int,
+}
+# Widget key -> design_inputs field, for tabs rendered before the central state existed
+_WIDGET_KEYS = {
+    "mu_pos": "mu_pos",
+    "mu_neg": "mu_neg",
+    "Vu": "vu",
+    "Tu": "tu",
+    "Vu_torsion": "vu_torsion",
+    "n_legs": "n_legs",
+    "stirrup_bar": "stirrup_bar",
+    "n_bars_torsion": "n_bars_torsion",
+}
+
 
 def init_design_state(session_state: dict[str, Any]) -> None:
     if "design_inputs" not in session_state:
@@ -15,16 +38,16 @@ def update_design_inputs(session_state: dict[str, Any], **kwargs: Any) -> None:
     session_state["design_inputs"].update(kwargs)
 
 
+def sync_widget_inputs(session_state: dict[str, Any]) -> None:
+    init_design_state(session_state)
+    session_state["design_inputs"].update(
+        {field: session_state[key] for key, field in _WIDGET_KEYS.items() if key in session_state}
+    )
+
+
 def get_design_snapshot(session_state: dict[str, Any]) -> DesignInputs:
     init_design_state(session_state)
     data = session_state["design_inputs"]
-    return DesignInputs(
-        mu_pos=float(data.get("mu_pos", 100.0)),
-        mu_neg=float(data.get("mu_neg", 0.0)),
-        vu=float(data.get("vu", 50.0)),
-        tu=float(data.get("tu", 15.0)),
-        vu_torsion=float(data.get("vu_torsion", float(data.get("vu", 50.0)))),
-        n_legs=int(data.get("n_legs", 2)),
-        stirrup_bar=str(data.get("stirrup_bar", '#3 (3/8")')),
-        n_bars_torsion=int(data.get("n_bars_torsion", 6)),
-    )
+    # vu_torsion falls back to the stored vu, then to the DesignInputs default
+    merged = {**_DEFAULTS, "vu_torsion": data.get("vu", _DEFAULTS["vu"]), **data}
+    return DesignInputs(**{key: coerce(merged[key]) for key, coerce in _COERCE.items()})
@@ -1,10 +1,25 @@
 
+import matplotlib
 import matplotlib.patches as patches
-import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+matplotlib.use("Agg")
+
+
+def _new_figure(figsize):
+    """Figure with its own Agg canvas, outside pyplot's global figure registry."""
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
 
 
 def draw_beam_section_flexure(b, h, cover, as_bot, as_top):
-    fig, ax = plt.subplots(figsize=(4, 4))
+    fig = _new_figure((4, 4))
+    ax = fig.subplots()
     rect = patches.Rectangle((0, 0), b, h, linewidth=2, edgecolor='#333333', facecolor='#e0e0e0')
     ax.add_patch(rect)
 
@@ -25,7 +40,8 @@ def draw_beam_section_flexure(b, h, cover, as_bot, as_top):
 
 def draw_beam_section_shear(b, h, cover, s_req, n_legs):
     """Draw cross section with stirrup legs and side elevation with spacing."""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(7, 4), gridspec_kw={'width_ratios': [1, 1.2]})
+    fig = _new_figure((7, 4))
+    ax1, ax2 = fig.subplots(1, 2, gridspec_kw={'width_ratios': [1, 1.2]})
 
     # --- Cross section ---
     rect = patches.Rectangle((0, 0), b, h, linewidth=2, edgecolor='#333333', facecolor='#e0e0e0')
@@ -40,10 +56,11 @@ def draw_beam_section_shear(b, h, cover, s_req, n_legs):
 
     # Internal legs if n_legs > 2
     if n_legs > 2:
-        inner_width = b - 2 * cover
-        for i in range(1, n_legs - 1):
-            x = cover + inner_width * i / (n_legs - 1)
-            ax1.plot([x, x], [cover, h - cover], color='#2e7d32', linewidth=1.5, linestyle='--')
+        xs = np.linspace(cover, b - cover, n_legs)[1:-1]
+        ax1.add_collection(LineCollection(
+            _vertical_segments(xs, cover, h - cover),
+            colors='#2e7d32', linewidths=1.5, linestyles='--',
+        ))
 
     ax1.set_xlim(-3, b + 3)
     ax1.set_ylim(-3, h + 3)
@@ -57,10 +74,10 @@ def draw_beam_section_shear(b, h, cover, s_req, n_legs):
                                      edgecolor='#333333', facecolor='#f5f5f5'))
 
     if s_req and s_req > 0:
-        x = cover
-        while x < beam_length - cover:
-            ax2.plot([x, x], [cover, h - cover], color='#2e7d32', linewidth=1.2)
-            x += s_req
+        xs = np.arange(cover, beam_length - cover, s_req)
+        ax2.add_collection(LineCollection(
+            _vertical_segments(xs, cover, h - cover), colors='#2e7d32', linewidths=1.2
+        ))
         ax2.set_title(f"Elevacion (s = {s_req:.1f} cm)", fontsize=9)
     else:
         ax2.set_title("Elevacion (sin estribos req.)", fontsize=9)
@@ -74,9 +91,19 @@ def draw_beam_section_shear(b, h, cover, s_req, n_legs):
     return fig
 
 
+def _vertical_segments(xs, y0, y1):
+    """(n, 2, 2) array of vertical segments from y0 to y1 at each x, for LineCollection."""
+    segs = np.empty((len(xs), 2, 2))
+    segs[:, :, 0] = np.asarray(xs)[:, None]
+    segs[:, 0, 1] = y0
+    segs[:, 1, 1] = y1
+    return segs
+
+
 def draw_beam_section_torsion(b, h, cover, al_total, n_long_bars=6):
     """Draw cross section with closed stirrups and longitudinal bars distributed on perimeter."""
-    fig, ax = plt.subplots(figsize=(2.5, 3))
+    fig = _new_figure((2.5, 3))
+    ax = fig.subplots()
 
     # Outer section
     rect = patches.Rectangle((0, 0), b, h, linewidth=1.5, edgecolor='#333333', facecolor='#e0e0e0')
@@ -91,8 +118,7 @@ def draw_beam_section_torsion(b, h, cover, al_total, n_long_bars=6):
 
     # Distribute longitudinal bars on perimeter
     positions = _distribute_bars_on_perimeter(b, h, cover, n_long_bars)
-    for (x, y) in positions:
-        ax.plot(x, y, 'ro', markersize=5, markeredgecolor='darkred', markerfacecolor='red')
+    ax.scatter(positions[:, 0], positions[:, 1], s=25, c='red', edgecolors='darkred', zorder=3)
 
     # Label
     if al_total > 0:
@@ -106,37 +132,70 @@ def draw_beam_section_torsion(b, h, cover, al_total, n_long_bars=6):
     return fig
 
 
+def beam_section_torsion_chart(b, h, cover, al_total, n_long_bars=6):
+    """
+    Client-side (Vega-Lite) version of draw_beam_section_torsion for st.altair_chart.
+
+    Only the outline, stirrup, bar coordinates and label are sent to the browser,
+    instead of a rasterized PNG on every rerun.
+    """
+    # Altair only arrives with Streamlit; the matplotlib figures do not need it.
+    import altair as alt
+
+    x_scale = alt.Scale(domain=[-4, b + 4], nice=False, zero=False)
+    y_scale = alt.Scale(domain=[-5, h + 4], nice=False, zero=False)
+    px_per_cm = min(200 / (b + 8), 300 / (h + 9))
+
+    def _rect(x0, y0, x1, y1, **mark):
+        data = pd.DataFrame({"x": [x0], "y": [y0], "x2": [x1], "y2": [y1]})
+        return alt.Chart(data).mark_rect(**mark).encode(
+            x=alt.X("x:Q", scale=x_scale, axis=None), x2="x2",
+            y=alt.Y("y:Q", scale=y_scale, axis=None), y2="y2",
+        )
+
+    positions = _distribute_bars_on_perimeter(b, h, cover, n_long_bars)
+    bars = alt.Chart(pd.DataFrame(positions, columns=["x", "y"])).mark_circle(
+        size=60, fill="red", stroke="darkred", opacity=1
+    ).encode(x=alt.X("x:Q", scale=x_scale, axis=None), y=alt.Y("y:Q", scale=y_scale, axis=None))
+
+    layers = [
+        _rect(0, 0, b, h, fill="#e0e0e0", stroke="#333333", strokeWidth=1.5),
+        _rect(cover, cover, b - cover, h - cover, filled=False, stroke="#7b1fa2", strokeWidth=2),
+        bars,
+    ]
+    if al_total > 0:
+        label = pd.DataFrame({"x": [b / 2], "y": [-3], "text": [f"Al: {al_total:.2f} cm2"]})
+        layers.append(alt.Chart(label).mark_text(color="darkred", fontSize=10).encode(
+            x=alt.X("x:Q", scale=x_scale, axis=None), y=alt.Y("y:Q", scale=y_scale, axis=None),
+            text="text:N",
+        ))
+
+    return alt.layer(*layers).properties(
+        width=round((b + 8) * px_per_cm), height=round((h + 9) * px_per_cm)
+    ).configure_view(stroke=None)
+
+
 def _distribute_bars_on_perimeter(b, h, cover, n_bars):
-    """Distribute n_bars around the inner perimeter (at stirrup corners and edges)."""
+    """Distribute n_bars around the inner perimeter (corners, then edges) as an (n, 2) array."""
     x_min, x_max = cover, b - cover
     y_min, y_max = cover, h - cover
 
-    if n_bars <= 4:
-        # Just corners
-        return [(x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)][:n_bars]
-
-    positions = []
     # Always place 4 corners first
-    positions.append((x_min, y_min))
-    positions.append((x_max, y_min))
-    positions.append((x_max, y_max))
-    positions.append((x_min, y_max))
+    corners = np.array(
+        [(x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)], dtype=float
+    )
+    if n_bars <= 4:
+        return corners[:max(n_bars, 0)]
 
+    # Distribute remaining bars along bottom and top edges
     remaining = n_bars - 4
-    if remaining <= 0:
-        return positions
-
-    # Distribute remaining bars along longer sides (bottom and top preferred)
-    # Split evenly: bottom, top, left side, right side
     n_bottom = max(1, remaining // 2)
     n_top = remaining - n_bottom
 
-    for i in range(1, n_bottom + 1):
-        x = x_min + (x_max - x_min) * i / (n_bottom + 1)
-        positions.append((x, y_min))
-
-    for i in range(1, n_top + 1):
-        x = x_min + (x_max - x_min) * i / (n_top + 1)
-        positions.append((x, y_max))
-
-    return positions
+    x_bottom = np.linspace(x_min, x_max, n_bottom + 2)[1:-1]
+    x_top = np.linspace(x_min, x_max, n_top + 2)[1:-1]
+    return np.concatenate([
+        corners,
+        np.column_stack([x_bottom, np.full_like(x_bottom, y_min)]),
+        np.column_stack([x_top, np.full_like(x_top, y_max)]),
+    ])
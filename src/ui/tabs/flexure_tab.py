@@ -1,21 +1,26 @@
 import streamlit as st
 import pandas as pd
 
-from src.models import flexure
 from src.models.flexure_checklist import build_flexure_checklist, build_flexure_summary
-from src.ui import plotting
+from src.models.result_types import Status
+from src.ui import cache
 from src.ui.design_state import get_design_snapshot, init_design_state, update_design_inputs
 
 
-def _render_status_box(status_code: str, message: str) -> None:
-    if status_code == "ok":
+def _render_status_box(status_code: Status, message: str) -> None:
+    if status_code == Status.OK:
         st.success(message)
-    elif status_code == "warning":
+    elif status_code == Status.WARNING:
         st.warning(message)
     else:
         st.error(message)
 
 
+def _render_steel_metrics(res) -> None:
+    for label, value in (("As mínimo", res.As_min), ("As calculado", res.As_calc), ("As diseño", res.As_design)):
+        st.metric(label, f"{value:.2f} cm²")
+
+
 def render(section):
     st.header("Diseño por Flexión (Momentos)")
     init_design_state(st.session_state)
@@ -31,8 +36,7 @@ def render(section):
 
     update_design_inputs(st.session_state, mu_pos=mu_pos, mu_neg=mu_neg)
 
-    res_bot = flexure.calculate_flexure(section, mu_pos)
-    res_top = flexure.calculate_flexure(section, mu_neg)
+    res_bot, res_top = cache.calculate_flexure_batch(section, (mu_pos, mu_neg))
 
     # 2) Resultados rápidos por cara
     st.subheader("Resultados rápidos por cara")
@@ -40,23 +44,23 @@ def render(section):
 
     with c1:
         st.write("Inferior (+)")
-        _render_status_box(res_bot["status_code"], f"As diseño: {res_bot['As_design']:.2f} cm²")
-        st.metric("As calculado", f"{res_bot['As_calc']:.2f} cm²")
+        _render_status_box(res_bot.status_code, f"As diseño: {res_bot.As_design:.2f} cm²")
+        st.metric("As calculado", f"{res_bot.As_calc:.2f} cm²")
 
     with c2:
         st.write("Superior (-)")
         if mu_neg > 0:
-            _render_status_box(res_top["status_code"], f"As diseño: {res_top['As_design']:.2f} cm²")
-            st.metric("As calculado", f"{res_top['As_calc']:.2f} cm²")
+            _render_status_box(res_top.status_code, f"As diseño: {res_top.As_design:.2f} cm²")
+            st.metric("As calculado", f"{res_top.As_calc:.2f} cm²")
         else:
             st.info("Sin momento negativo, gobierna acero mínimo.")
-            st.metric("As mínimo", f"{res_top['As_min']:.2f} cm²")
+            st.metric("As mínimo", f"{res_top.As_min:.2f} cm²")
 
     with c3:
         st.write("Esquema")
-        as_b = res_bot["As_design"] if mu_pos > 0 else 0
-        as_t = res_top["As_design"] if mu_neg > 0 else 0
-        fig = plotting.draw_beam_section_flexure(section.b, section.h, section.cover, as_b, as_t)
+        as_b = res_bot.As_design if mu_pos > 0 else 0
+        as_t = res_top.As_design if mu_neg > 0 else 0
+        fig = cache.draw_beam_section_flexure(section.b, section.h, section.cover, as_b, as_t)
         st.pyplot(fig)
 
     # 3) Acero mínimo y control gobernante
@@ -68,22 +72,18 @@ def render(section):
     s1, s2 = st.columns(2)
     with s1:
         st.markdown("#### Cara inferior (+)")
-        st.metric("As mínimo", f"{res_bot['As_min']:.2f} cm²")
-        st.metric("As calculado", f"{res_bot['As_calc']:.2f} cm²")
-        st.metric("As diseño", f"{res_bot['As_design']:.2f} cm²")
+        _render_steel_metrics(res_bot)
         st.caption(f"Controla: {summary_bot['criterio_gobernante']}")
         st.caption(
-            f"rho={res_bot['rho']:.5f} | phi={res_bot['phi']:.3f} | epsilon_t={res_bot['epsilon_t']:.5f}"
+            f"rho={res_bot.rho:.5f} | phi={res_bot.phi:.3f} | epsilon_t={res_bot.epsilon_t:.5f}"
         )
 
     with s2:
         st.markdown("#### Cara superior (-)")
-        st.metric("As mínimo", f"{res_top['As_min']:.2f} cm²")
-        st.metric("As calculado", f"{res_top['As_calc']:.2f} cm²")
-        st.metric("As diseño", f"{res_top['As_design']:.2f} cm²")
+        _render_steel_metrics(res_top)
         st.caption(f"Controla: {summary_top['criterio_gobernante']}")
         st.caption(
-            f"rho={res_top['rho']:.5f} | phi={res_top['phi']:.3f} | epsilon_t={res_top['epsilon_t']:.5f}"
+            f"rho={res_top.rho:.5f} | phi={res_top.phi:.3f} | epsilon_t={res_top.epsilon_t:.5f}"
         )
 
     if summary_bot["criterio_gobernante"] == "Gobierna acero mínimo":
@@ -1,10 +1,25 @@
-import json
-
 import pandas as pd
 import streamlit as st
 
-from src.models.reporting import build_design_report
-from src.ui.design_state import get_design_snapshot, init_design_state
+from src.models.result_types import Status
+from src.ui import cache
+from src.ui.design_state import get_design_snapshot, init_design_state, sync_widget_inputs
+
+_LOAD_LABELS = ("Mu+ [kNm]", "Mu- [kNm]", "Vu [kN]", "Tu [kNm]")
+_FACE_LABELS = ("Inferior", "Superior", "Lateral (c/u)")
+_COMBINED_COLS = ("Cara", "As Flexion (cm2)", "Al Torsion (cm2)", "TOTAL (cm2)")
+_LONG_LABELS = ("Inferior (Flexion +)", "Superior (Flexion -)")
+_LONG_COLS = ("Ubicacion", "As Requerido (cm2)", "Comentarios")
+_FLEX_COLS = (
+    "cara",
+    "estado",
+    "criterio_gobernante",
+    "ductilidad_alerta",
+    "As_min_cm2",
+    "As_design_cm2",
+    "phi",
+    "epsilon_t",
+)
 
 
 def render(section):
@@ -12,34 +27,17 @@ def render(section):
     init_design_state(st.session_state)
 
     # Sync widget-only keys into central state (supports old navigation order)
-    if "mu_pos" in st.session_state:
-        st.session_state["design_inputs"]["mu_pos"] = st.session_state["mu_pos"]
-    if "mu_neg" in st.session_state:
-        st.session_state["design_inputs"]["mu_neg"] = st.session_state["mu_neg"]
-    if "Vu" in st.session_state:
-        st.session_state["design_inputs"]["vu"] = st.session_state["Vu"]
-    if "Tu" in st.session_state:
-        st.session_state["design_inputs"]["tu"] = st.session_state["Tu"]
-    if "Vu_torsion" in st.session_state:
-        st.session_state["design_inputs"]["vu_torsion"] = st.session_state["Vu_torsion"]
-    if "n_legs" in st.session_state:
-        st.session_state["design_inputs"]["n_legs"] = st.session_state["n_legs"]
-    if "stirrup_bar" in st.session_state:
-        st.session_state["design_inputs"]["stirrup_bar"] = st.session_state["stirrup_bar"]
-    if "n_bars_torsion" in st.session_state:
-        st.session_state["design_inputs"]["n_bars_torsion"] = st.session_state["n_bars_torsion"]
+    sync_widget_inputs(st.session_state)
 
     snapshot = get_design_snapshot(st.session_state)
-    bundle = build_design_report(section, snapshot)
+    bundle = cache.build_report(section, snapshot)
 
     st.subheader("Cargas de Diseno")
     st.caption("Valores tomados del estado central de diseño para mantener consistencia entre pestañas.")
 
-    lc1, lc2, lc3, lc4 = st.columns(4)
-    lc1.metric("Mu+ [kNm]", f"{snapshot.mu_pos:.1f}")
-    lc2.metric("Mu- [kNm]", f"{snapshot.mu_neg:.1f}")
-    lc3.metric("Vu [kN]", f"{snapshot.vu:.1f}")
-    lc4.metric("Tu [kNm]", f"{snapshot.tu:.1f}")
+    load_values = (snapshot.mu_pos, snapshot.mu_neg, snapshot.vu, snapshot.tu)
+    for col, label, value in zip(st.columns(4), _LOAD_LABELS, load_values):
+        col.metric(label, f"{value:.1f}")
 
     st.divider()
     res_flex_pos = bundle.flexure_pos
@@ -47,7 +45,7 @@ def render(section):
     res_shear = bundle.shear_res
     res_tors = bundle.torsion_res
     dist = bundle.torsion_dist
-    torsion_significant = "Required" in res_tors.status or dist.al_total > 0
+    torsion_significant = res_tors.status_code == Status.WARNING or dist.al_total > 0
     al_bottom = dist.al_bottom
     al_top = dist.al_top
     al_side = dist.al_side_each
@@ -64,72 +62,49 @@ def render(section):
         st.markdown("**Combinacion Flexion + Torsion Longitudinal (ACI 318-19)**")
 
         # Combined table
-        combined_data = {
-            "Cara": ["Inferior", "Superior", "Lateral (c/u)"],
-            "As Flexion (cm2)": [
-                f"{as_flex_bot:.2f}",
-                f"{as_flex_top:.2f}",
-                "---"
-            ],
-            "Al Torsion (cm2)": [
-                f"{al_bottom:.2f}",
-                f"{al_top:.2f}",
-                f"{al_side:.2f}"
-            ],
-            "TOTAL (cm2)": [
-                f"{(as_flex_bot + al_bottom):.2f}",
-                f"{(as_flex_top + al_top):.2f}",
-                f"{al_side:.2f}"
-            ],
-        }
+        # Each value is formatted once and shared by the table and the metrics
+        flex_bot, flex_top, tors_bot, tors_top, tors_side, total_bot, total_top = (
+            f"{value:.2f}"
+            for value in (
+                as_flex_bot, as_flex_top, al_bottom, al_top, al_side,
+                as_flex_bot + al_bottom, as_flex_top + al_top,
+            )
+        )
+        combined_data = dict(zip(_COMBINED_COLS, (
+            _FACE_LABELS,
+            (flex_bot, flex_top, "---"),
+            (tors_bot, tors_top, tors_side),
+            (total_bot, total_top, tors_side),
+        )))
         st.table(pd.DataFrame(combined_data))
 
         # Summary metrics
-        total_bot = as_flex_bot + al_bottom
-        total_top = as_flex_top + al_top
-
         mc1, mc2, mc3 = st.columns(3)
-        mc1.metric("As Total Inferior", f"{total_bot:.2f} cm2",
-                   delta=f"+{al_bottom:.2f} por torsion" if al_bottom > 0 else None)
-        mc2.metric("As Total Superior", f"{total_top:.2f} cm2",
-                   delta=f"+{al_top:.2f} por torsion" if al_top > 0 else None)
-        mc3.metric("As Lateral (c/lado)", f"{al_side:.2f} cm2")
+        mc1.metric("As Total Inferior", f"{total_bot} cm2",
+                   delta=f"+{tors_bot} por torsion" if al_bottom > 0 else None)
+        mc2.metric("As Total Superior", f"{total_top} cm2",
+                   delta=f"+{tors_top} por torsion" if al_top > 0 else None)
+        mc3.metric("As Lateral (c/lado)", f"{tors_side} cm2")
 
         st.caption("Nota: El acero por torsion longitudinal se suma al acero por flexion en cada cara. "
                    "El acero lateral es adicional y se coloca en las caras del alma.")
 
     else:
         # No significant torsion - simple table
-        long_data = {
-            "Ubicacion": ["Inferior (Flexion +)", "Superior (Flexion -)"],
-            "As Requerido (cm2)": [
-                f"{as_flex_bot:.2f}",
-                f"{as_flex_top:.2f}"
-            ],
-            "Comentarios": [
+        long_data = dict(zip(_LONG_COLS, (
+            _LONG_LABELS,
+            (f"{as_flex_bot:.2f}", f"{as_flex_top:.2f}"),
+            (
                 res_flex_pos.status,
-                res_flex_neg.status if snapshot.mu_neg > 0 else "Sin momento negativo"
-            ]
-        }
+                res_flex_neg.status if snapshot.mu_neg > 0 else "Sin momento negativo",
+            ),
+        )))
         st.table(pd.DataFrame(long_data))
         st.info("Torsión despreciable: no se requiere acero longitudinal adicional por torsión.")
 
     st.subheader("Checklist Flexión (resumen)")
     st.caption("Resumen por cara: estado, criterio gobernante y alerta de ductilidad.")
-    flex_summary_df = pd.DataFrame(
-        bundle.flexure_summary,
-        columns=[
-            "cara",
-            "estado",
-            "criterio_gobernante",
-            "ductilidad_alerta",
-            "As_min_cm2",
-            "As_design_cm2",
-            "phi",
-            "epsilon_t",
-        ],
-    )
-    st.table(flex_summary_df)
+    st.table(cache.flexure_summary_df(section, snapshot, _FLEX_COLS))
 
     # ──────────────────────────────────────────────────────────────
     # 2. REFUERZO TRANSVERSAL
@@ -139,14 +114,14 @@ def render(section):
 
     st.write(f"**Cortante Vs:** {res_shear.Vs_req:.2f} kN")
 
-    if "Neglectable" in res_tors.status:
+    if res_tors.status_code == Status.OK:
         st.success("Torsión despreciable. Diseñar solo por cortante.")
         s_req = res_shear.s_req
         if s_req is not None:
             st.metric("Separacion Estribos (Cortante)", f"{s_req:.1f} cm")
         else:
             st.info(res_shear.status)
-    elif "Error" in res_tors.status:
+    elif res_tors.status_code == Status.ERROR:
         st.error("Error en Torsión: " + res_tors.status)
     else:
         st.warning("Torsión significativa. Se requieren estribos cerrados.")
@@ -172,20 +147,27 @@ def render(section):
 
     st.divider()
     st.subheader("5. Exportación")
-    payload = bundle.export_payload()
-    criteria_df = pd.DataFrame(bundle.governing_criteria)
-    csv_data = criteria_df.to_csv(index=False).encode("utf-8")
+    _render_exports(section, snapshot)
+
+
+@st.fragment
+def _render_exports(section, snapshot):
+    # Runs as a fragment: toggling or downloading reruns only this block, and the
+    # files are only encoded once the user asks for them.
+    if not st.toggle("Preparar archivos de descarga", key="prepare_exports"):
+        st.caption("Activar para generar los archivos CSV y JSON del diseño actual.")
+        return
 
     cexp1, cexp2 = st.columns(2)
     cexp1.download_button(
         label="Descargar criterios (CSV)",
-        data=csv_data,
+        data=cache.criteria_csv(section, snapshot),
         file_name="rc_beam_governing_criteria.csv",
         mime="text/csv",
     )
     cexp2.download_button(
         label="Descargar reporte técnico (JSON)",
-        data=json.dumps(payload, indent=2, ensure_ascii=False),
+        data=cache.report_json(section, snapshot),
         file_name="rc_beam_report_payload.json",
         mime="application/json",
     )
@@ -1,10 +1,22 @@
 import streamlit as st
 
-from src.models import torsion
+from src.models.result_types import Status
 from src.models.torsion_distribution import distribute_torsion_longitudinal_reinf
-from src.ui import plotting
+from src.ui import cache, plotting
 from src.ui.design_state import get_design_snapshot, init_design_state, update_design_inputs
 
+# Draw the section as a client-side Altair chart; False falls back to the
+# cached matplotlib figure.
+USE_ALTAIR_CHART = True
+
+_NO_AL_TORSION = {
+    "al_torsion_bottom": 0.0,
+    "al_torsion_top": 0.0,
+    "al_torsion_side": 0.0,
+    "al_torsion_total": 0.0,
+    "al_torsion_n_bars": 0,
+}
+
 
 def render(section):
     st.header("Diseño por Torsión (T)")
@@ -20,41 +32,41 @@ def render(section):
 
     update_design_inputs(st.session_state, tu=Tu, vu_torsion=Vu)
 
-    res = torsion.calculate_torsion(section, Tu, Vu)
+    res = cache.calculate_torsion(section, Tu, Vu)
 
     st.divider()
 
     # Threshold check
     c1, c2, c3 = st.columns(3)
     c1.metric("Tu (Aplicado)", f"{Tu:.2f} kNm")
-    c2.metric("T_th (Umbral)", f"{res['T_th']:.2f} kNm", help="Torsión umbral para despreciar efectos")
-    c3.metric("T_cr (Agrietamiento)", f"{res['T_cr']:.2f} kNm", help="Torsión de agrietamiento")
+    c2.metric("T_th (Umbral)", f"{res.T_th:.2f} kNm", help="Torsión umbral para despreciar efectos")
+    c3.metric("T_cr (Agrietamiento)", f"{res.T_cr:.2f} kNm", help="Torsión de agrietamiento")
 
     # Status Logic
-    if "Neglectable" in res['status']:
-        st.success(res['status'])
+    if res.status_code == Status.OK:
+        st.success(res.status)
         st.info("No se requiere refuerzo específico por torsión.")
-    elif "Error" in res['status']:
-        st.error(res['status'])
-        st.write(f"Verificacion Seccion: {res['check_cross_section']}")
+    elif res.status_code == Status.ERROR:
+        st.error(res.status)
+        st.write(f"Verificacion Seccion: {res.check_cross_section}")
     else:
-        st.warning(res['status'])
+        st.warning(res.status)
 
         st.subheader("Refuerzo Requerido")
 
         rc1, rc2 = st.columns(2)
         with rc1:
             st.markdown("#### Estribos Cerrados")
-            st.metric("At/s (una rama)", f"{res.get('At_s_req', 0):.4f} mm2/mm")
-            st.caption(f"Equivale a {res.get('At_s_req_cm2_m', 0):.2f} cm2/m por rama")
+            st.metric("At/s (una rama)", f"{res.At_s_req:.4f} mm2/mm")
+            st.caption(f"Equivale a {res.At_s_req_cm2_m:.2f} cm2/m por rama")
 
         with rc2:
             st.markdown("#### Refuerzo Longitudinal Adicional")
-            st.metric("Al Total", f"{res.get('Al_req', 0):.2f} cm2")
+            st.metric("Al Total", f"{res.Al_req:.2f} cm2")
             st.caption("Distribuir en el perímetro de la sección (ACI 9.5.4.3)")
 
         # --- Distribution of Al along perimeter ---
-        al_total = res.get('Al_req', 0)
+        al_total = res.Al_req
         if al_total > 0:
             st.divider()
             st.subheader("Distribución de Al en el Perímetro")
@@ -87,26 +99,29 @@ def render(section):
             st.info(f"Área por barra: **{dist.al_per_bar:.2f} cm2** ({dist.n_bars} barras total)")
 
             # Store distribution in session state for report tab
-            st.session_state["al_torsion_bottom"] = dist.al_bottom
-            st.session_state["al_torsion_top"] = dist.al_top
-            st.session_state["al_torsion_side"] = dist.al_side_each
-            st.session_state["al_torsion_total"] = al_total
-            st.session_state["al_torsion_n_bars"] = dist.n_bars
+            st.session_state.update({
+                "al_torsion_bottom": dist.al_bottom,
+                "al_torsion_top": dist.al_top,
+                "al_torsion_side": dist.al_side_each,
+                "al_torsion_total": al_total,
+                "al_torsion_n_bars": dist.n_bars,
+            })
         else:
-            st.session_state["al_torsion_bottom"] = 0.0
-            st.session_state["al_torsion_top"] = 0.0
-            st.session_state["al_torsion_side"] = 0.0
-            st.session_state["al_torsion_total"] = 0.0
-            st.session_state["al_torsion_n_bars"] = 0
+            st.session_state.update(_NO_AL_TORSION)
 
         with st.expander("Verificacion de Seccion Transversal"):
-            st.write(res.get('check_cross_section', 'N/A'))
+            st.write(res.check_cross_section)
 
         # Visualization
         st.subheader("Esquema")
-        fig = plotting.draw_beam_section_torsion(
-            section.b, section.h, section.cover,
-            al_total=al_total,
-            n_long_bars=st.session_state.get("al_torsion_n_bars", 6)
-        )
-        st.pyplot(fig, use_container_width=False)
+        n_long_bars = st.session_state.get("al_torsion_n_bars", 6)
+        if USE_ALTAIR_CHART:
+            chart = plotting.beam_section_torsion_chart(
+                section.b, section.h, section.cover, al_total=al_total, n_long_bars=n_long_bars
+            )
+            st.altair_chart(chart, use_container_width=False)
+        else:
+            fig = cache.draw_beam_section_torsion(
+                section.b, section.h, section.cover, al_total=al_total, n_long_bars=n_long_bars
+            )
+            st.pyplot(fig, use_container_width=False)
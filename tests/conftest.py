@@ -0,0 +1,8 @@
+import pytest
+
+from src.models.section import BeamSection
+
+
+@pytest.fixture(scope="session")
+def standard_section():
+    return BeamSection(b=30, h=50, fc=28, fy=420, cover=4)
@@ -0,0 +1,27 @@
+import pytest
+
+from src.models.combined import calculate_shear_and_torsion
+from src.models.result_types import Status
+from src.models.section import BeamSection
+from src.models.shear import calculate_shear
+from src.models.torsion import calculate_torsion
+
+
+@pytest.mark.parametrize("Vu, Tu", [(5.0, 1.0), (100.0, 20.0), (-50.0, -20.0), (500.0, 100.0)])
+def test_matches_separate_calls(standard_section, Vu, Tu):
+    res_shear, res_tors = calculate_shear_and_torsion(standard_section, Vu, Tu, 3, 1.27)
+    assert res_shear.to_dict() == calculate_shear(standard_section, Vu, 3, 1.27).to_dict()
+    assert res_tors.to_dict() == calculate_torsion(standard_section, Tu, Vu).to_dict()
+
+
+def test_separate_torsion_shear(standard_section):
+    res_shear, res_tors = calculate_shear_and_torsion(standard_section, 100.0, 20.0, Vu_torsion=30.0)
+    assert res_shear.to_dict() == calculate_shear(standard_section, 100.0).to_dict()
+    assert res_tors.to_dict() == calculate_torsion(standard_section, 20.0, 30.0).to_dict()
+
+
+def test_invalid_section():
+    section = BeamSection(b=30, h=50, fc=28, fy=420, cover=20)
+    res_shear, res_tors = calculate_shear_and_torsion(section, 100.0, 20.0)
+    assert res_shear.status_code == Status.ERROR
+    assert res_tors.status_code == Status.ERROR
@@ -1,4 +1,12 @@
-from src.ui.design_state import get_design_snapshot, init_design_state, update_design_inputs
+from dataclasses import asdict
+
+from src.models.design_inputs import DesignInputs
+from src.ui.design_state import (
+    get_design_snapshot,
+    init_design_state,
+    sync_widget_inputs,
+    update_design_inputs,
+)
 
 
 def test_design_state_snapshot_updates_consistently():
@@ -10,3 +18,29 @@ def test_design_state_snapshot_updates_consistently():
     assert snap.mu_pos == 150.0
     assert snap.vu == 95.0
     assert snap.n_legs == 4
+
+
+def test_design_inputs_to_dict_covers_all_fields():
+    inputs = DesignInputs(mu_pos=120.0, stirrup_bar='#4 (1/2")')
+    assert inputs.to_dict() == asdict(inputs)
+
+
+def test_design_snapshot_fills_missing_fields():
+    session_state: dict[str, object] = {"design_inputs": {"vu": "80", "n_legs": 3.0, "extra": 1}}
+    snap = get_design_snapshot(session_state)
+
+    assert snap.vu == 80.0
+    assert snap.vu_torsion == 80.0
+    assert snap.n_legs == 3
+    assert snap.mu_pos == DesignInputs().mu_pos
+
+
+def test_sync_widget_inputs_maps_widget_keys():
+    session_state: dict[str, object] = {"Vu": 120.0, "Tu": 30.0, "n_legs": 4}
+    sync_widget_inputs(session_state)
+    snap = get_design_snapshot(session_state)
+
+    assert snap.vu == 120.0
+    assert snap.tu == 30.0
+    assert snap.n_legs == 4
+    assert snap.mu_pos == DesignInputs().mu_pos
@@ -0,0 +1,46 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.models.design_sweep import (
+    SWEEP_INVALID_GEOMETRY,
+    SWEEP_OK,
+    SWEEP_SHEAR_FAIL,
+    SWEEP_TORSION_FAIL,
+    sweep_shear_torsion,
+)
+from src.models.result_types import Status
+from src.models.section import BeamSection
+from src.models.shear import calculate_shear
+from src.models.torsion import calculate_torsion
+
+
+@pytest.mark.parametrize("Vu, Tu", [(5.0, 1.0), (150.0, 20.0), (400.0, 60.0)])
+def test_sweep_matches_scalar(Vu, Tu):
+    b = np.array([20.0, 30.0, 40.0])
+    h = np.array([40.0, 50.0, 70.0])
+    out = sweep_shear_torsion(b, h, 28, 420, 4, Vu, Tu)
+    assert out["status"].shape == (3, 3)
+    for i, bi in enumerate(b):
+        for j, hj in enumerate(h):
+            section = BeamSection(bi, hj, 28, 420, 4)
+            res_shear = calculate_shear(section, Vu)
+            res_tors = calculate_torsion(section, Tu, Vu)
+            status = out["status"][i, j]
+            assert bool(status & SWEEP_SHEAR_FAIL) == (res_shear.status_code == Status.ERROR)
+            assert bool(status & SWEEP_TORSION_FAIL) == (res_tors.status_code == Status.ERROR)
+            if res_shear.s_req is None:
+                assert math.isnan(out["s_req"][i, j])
+            else:
+                assert out["s_req"][i, j] == pytest.approx(res_shear.s_req)
+            if status == SWEEP_OK:
+                assert out["At_s_req"][i, j] == pytest.approx(res_tors.At_s_req)
+                assert out["Al_req"][i, j] == pytest.approx(res_tors.Al_req)
+
+
+def test_sweep_invalid_geometry():
+    out = sweep_shear_torsion([10.0, 30.0], [50.0], 28, 420, 6, 100.0, 10.0)
+    assert out["status"][0, 0] == SWEEP_INVALID_GEOMETRY
+    assert math.isnan(out["Al_req"][0, 0])
+    assert out["status"][1, 0] != SWEEP_INVALID_GEOMETRY
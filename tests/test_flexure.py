@@ -1,12 +1,25 @@
+from dataclasses import asdict
+
+import numpy as np
 import pytest
 
-from src.models.flexure import calculate_flexure
+from src.models.aci_constants import PHI_COMPRESSION
+from src.models.flexure import (
+    calculate_flexure,
+    calculate_flexure_batch,
+    calculate_flexure_sweep,
+    min_steel_result,
+)
+from src.models.result_types import STATUS_CODE_DTYPE, Status
 from src.models.section import BeamSection
 
+SWEEP_KEYS = ('As_calc', 'As_min', 'As_design', 'rho', 'phi', 'epsilon_t', 'c', 'a', 'status_code')
+
 
-@pytest.fixture
-def standard_section():
-    return BeamSection(b=30, h=50, fc=28, fy=420, cover=4)
+@pytest.fixture(scope="module")
+def fc_sweep():
+    fcs = np.array([21, 28, 35, 42, 55, 70], dtype=float)
+    return fcs, calculate_flexure_sweep(30, 50, fcs, 420, 4, 100)
 
 
 class TestFlexure:
@@ -56,17 +69,78 @@ class TestFlexure:
         assert isinstance(res['trace'], list)
         assert len(res['trace']) >= 1
 
+    def test_mapping_access_matches_to_dict(self, standard_section):
+        res = calculate_flexure(standard_section, -100)
+        data = res.to_dict()
+        assert {key: res[key] for key in res} == data
+        assert dict(res.items()) == data
+        assert res['status_code'] == 'ok'
+        assert res.status_code is Status.OK
+        assert res.get('missing', 'default') == 'default'
+        with pytest.raises(KeyError):
+            res['missing']
+
+    def test_trace_serializes_all_fields(self, standard_section):
+        res = calculate_flexure(standard_section, -100)
+        expected = []
+        for t in res.trace:
+            row = asdict(t)
+            row['inputs'] = dict(zip(row.pop('input_names'), row['inputs']))
+            expected.append(row)
+        assert res.to_dict()['trace'] == expected
+        assert expected[0]['inputs'] == {'raw_input': -100}
+
+    def test_min_steel_result_matches_zero_moment(self, standard_section):
+        assert min_steel_result(standard_section) == calculate_flexure(standard_section, 0)
+
+    @pytest.mark.parametrize("Mu", [0, 100, 1000, -100])
+    def test_without_trace(self, standard_section, Mu):
+        traced = calculate_flexure(standard_section, Mu)
+        untraced = calculate_flexure(standard_section, Mu, with_trace=False)
+        assert untraced.trace == []
+        assert untraced.status == traced.status
+        assert untraced.As_design == traced.As_design
+
     def test_hand_calc_validation(self):
         """Validate against known: 30x50cm, fc=28, fy=420, Mu=150kNm -> As ~9-10 cm2."""
         section = BeamSection(30, 50, 28, 420, 4)
         res = calculate_flexure(section, 150)
         assert 8.0 < res['As_design'] < 11.0
 
-    @pytest.mark.parametrize("fc", [21, 28, 35, 42, 55, 70])
-    def test_various_concrete_strengths(self, fc):
-        section = BeamSection(30, 50, fc, 420, 4)
-        res = calculate_flexure(section, 100)
-        assert res['As_calc'] > 0
+    def test_hand_calc_transition(self, standard_section):
+        """
+        30x50cm, fc=28, fy=420, d=460mm, beta1=0.85; take c = 200 mm:
+        eps_t = 0.003*260/200 = 0.0039, phi = 0.65 + 0.25*(0.0039-0.002)/0.003 = 0.80833,
+        a = 170 mm, As = 0.85*28*300*170/420 = 2890 mm2,
+        phi*Mn = 0.80833 * 2890*420*(460 - 85) = 367.933 kNm.
+        """
+        res = calculate_flexure(standard_section, 367.933)
+        assert res.phi == pytest.approx(0.80833, abs=1e-5)
+        assert res.As_calc == pytest.approx(28.90, abs=1e-3)
+        assert res.c == pytest.approx(20.0, abs=1e-3)
+        phi_Mn = res.phi * res.As_calc * 100 * 420 * (460 - res.a * 10 / 2) / 1e6
+        assert phi_Mn == pytest.approx(367.933, rel=1e-9)
+
+    def test_hand_calc_compression(self, standard_section):
+        """
+        Same section with c = 300 mm: eps_t = 0.003*160/300 = 0.0016 < 0.002, phi = 0.65,
+        a = 255 mm, As = 0.85*28*300*255/420 = 4335 mm2,
+        phi*Mn = 0.65 * 4335*420*(460 - 127.5) = 393.499 kNm.
+        """
+        res = calculate_flexure(standard_section, 393.499)
+        assert res.phi == PHI_COMPRESSION
+        assert res.epsilon_t == pytest.approx(0.0016, abs=1e-6)
+        assert res.As_calc == pytest.approx(43.35, abs=1e-3)
+        phi_Mn = res.phi * res.As_calc * 100 * 420 * (460 - res.a * 10 / 2) / 1e6
+        assert phi_Mn == pytest.approx(393.499, rel=1e-9)
+
+    def test_various_concrete_strengths(self, fc_sweep):
+        fcs, out = fc_sweep
+        assert (out['As_calc'] > 0).all()
+        for i, fc in enumerate(fcs):
+            res = calculate_flexure(BeamSection(30, 50, fc, 420, 4), 100)
+            for key in SWEEP_KEYS:
+                assert out[key][i] == pytest.approx(getattr(res, key))
 
     @pytest.mark.parametrize("fy", [280, 420, 500])
     def test_various_steel_grades(self, fy):
@@ -87,3 +161,35 @@ class TestFlexure:
         r1 = calculate_flexure(s1, 100)
         r2 = calculate_flexure(s2, 100)
         assert r1['As_calc'] > r2['As_calc']
+
+
+class TestFlexureBatch:
+    @pytest.mark.parametrize("Mu", [0, 50, 100, 150, 250, 320, 1000, -100])
+    def test_batch_matches_scalar(self, standard_section, Mu):
+        scalar = calculate_flexure(standard_section, Mu)
+        (batch,) = calculate_flexure_batch(standard_section, [Mu])
+        assert batch.status == scalar.status
+        assert batch.status_code == scalar.status_code
+        for key in ('As_calc', 'As_min', 'As_design', 'rho', 'phi', 'epsilon_t', 'c', 'a'):
+            assert batch[key] == pytest.approx(scalar[key], rel=1e-9, abs=1e-12)
+        assert len(batch.trace) == len(scalar.trace)
+
+    def test_batch_preserves_order(self, standard_section):
+        results = calculate_flexure_batch(standard_section, [150, 0, 1000])
+        assert [r.status_code for r in results] == [Status.OK, Status.OK, Status.ERROR]
+        assert results[0]['As_calc'] > 0
+        assert results[1]['As_calc'] == 0.0
+
+    def test_batch_without_trace(self, standard_section):
+        results = calculate_flexure_batch(standard_section, [-100, 0, 1000], with_trace=False)
+        assert all(r.trace == [] for r in results)
+
+    def test_sweep_matches_scalar(self):
+        Mu = np.array([0, 50, 250, 320, 1000, -100, 100], dtype=float)
+        cover = np.array([4, 4, 4, 4, 4, 4, 20], dtype=float)
+        out = calculate_flexure_sweep(30, 50, 28, 420, cover, Mu)
+        assert out['status_code'].dtype == STATUS_CODE_DTYPE
+        for i, (mu, cv) in enumerate(zip(Mu, cover)):
+            res = calculate_flexure(BeamSection(30, 50, 28, 420, cv), mu)
+            for key in SWEEP_KEYS:
+                assert out[key][i] == pytest.approx(getattr(res, key), rel=1e-9, abs=1e-12)
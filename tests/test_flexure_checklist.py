@@ -1,5 +1,6 @@
 from src.models.flexure import calculate_flexure
 from src.models.flexure_checklist import build_flexure_checklist, build_flexure_summary
+from src.models.result_types import Status
 from src.models.section import BeamSection
 
 
@@ -29,7 +30,7 @@ def test_low_ductility_case_marks_warning():
     warning_case = None
     for mu in range(200, 1000, 10):
         candidate = calculate_flexure(section, float(mu))
-        if candidate.status_code == "warning":
+        if candidate.status_code == Status.WARNING:
             warning_case = candidate
             break
 
@@ -43,6 +44,6 @@ def test_overloaded_section_has_capacity_failure_item():
     res = calculate_flexure(section, 1000.0)
     checklist = build_flexure_checklist("Inferior (+)", res)
 
-    assert res.status_code == "error"
+    assert res.status_code == Status.ERROR
     assert any(row["Formula"] == "phiMn_quadratic_discriminant" for row in checklist)
     assert any(row["Estado"] == "no cumple" for row in checklist)
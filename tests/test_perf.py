@@ -0,0 +1,28 @@
+import logging
+
+import pytest
+
+from src.models._perf import MODELS_LOGGER, configure_for_design_sweep
+from src.models.section import BeamSection
+from src.models.shear import calculate_shear
+
+
+@pytest.fixture
+def models_logger():
+    logger = logging.getLogger(MODELS_LOGGER)
+    saved = (logger.level, logger.propagate, list(logger.handlers))
+    yield logger
+    logger.setLevel(saved[0])
+    logger.propagate = saved[1]
+    logger.handlers[:] = saved[2]
+
+
+def test_configure_for_design_sweep(models_logger):
+    configure_for_design_sweep()
+    configure_for_design_sweep()
+    assert not logging.getLogger("src.models.shear").isEnabledFor(logging.INFO)
+    assert models_logger.propagate is False
+    assert sum(isinstance(h, logging.NullHandler) for h in models_logger.handlers) == 1
+
+    res = calculate_shear(BeamSection(30, 50, 28, 420, 4), 100)
+    assert res.s_req is not None
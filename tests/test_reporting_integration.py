@@ -1,3 +1,7 @@
+import json
+
+import pytest
+
 from src.models.design_inputs import DesignInputs
 from src.models.reporting import build_design_report
 from src.models.section import BeamSection
@@ -37,3 +41,24 @@ def test_report_deterministic_for_same_inputs():
     p1 = build_design_report(section, design_inputs).export_payload()
     p2 = build_design_report(section, design_inputs).export_payload()
     assert p1 == p2
+
+
+def test_report_bundle_is_immutable_and_payload_is_json():
+    section = BeamSection(30, 50, 28, 420, 4)
+    bundle = build_design_report(section, DesignInputs(mu_pos=100, mu_neg=20, vu=80, tu=20))
+
+    assert isinstance(bundle.warnings, tuple)
+    with pytest.raises(TypeError):
+        bundle.governing_criteria[0]["estado"] = "x"
+    payload = bundle.export_payload()
+    assert json.loads(json.dumps(payload)) == payload
+    assert json.loads(bundle.export_json()) == payload
+
+
+def test_export_json_status_codes_are_labels():
+    section = BeamSection(30, 50, 28, 420, 4)
+    bundle = build_design_report(section, DesignInputs(mu_pos=100, mu_neg=1000, vu=80, tu=20))
+
+    payload = json.loads(bundle.export_json())
+    codes = [payload[key]["status_code"] for key in ("flexure_pos", "flexure_neg", "shear", "torsion")]
+    assert codes == ["ok", "error", "ok", "warning"]
@@ -13,6 +13,33 @@ class TestBeamSection:
         assert s.fy == 420
         assert s.cover == 4
 
+    def test_sqrt_fc(self):
+        s = BeamSection(30, 50, 25, 420, 4)
+        assert s.sqrt_fc == pytest.approx(5.0)
+
+    def test_geometry_in_mm(self):
+        s = BeamSection(30, 50, 28, 420, 4)
+        assert (s.b_mm, s.h_mm, s.cover_mm, s.d_mm) == (300, 500, 40, 460)
+        assert s.Acp == 300 * 500
+        assert s.Pcp == 2 * (300 + 500)
+        assert s.Aoh == 220 * 420
+        assert s.Ph == 2 * (220 + 420)
+
+    def test_geometry_errors(self):
+        assert BeamSection(30, 50, 28, 420, 4).geometry_errors == ()
+        assert BeamSection(10, 50, 28, 420, 6).geometry_errors
+
+    def test_flex_terms(self):
+        s = BeamSection(30, 50, 28, 420, 4)
+        assert s.flex_term_A == pytest.approx(420 ** 2 / (2 * 0.85 * 28 * 300))
+        assert s.flex_term_B == pytest.approx(-420 * 460)
+
+    def test_slots(self):
+        s = BeamSection(30, 50, 28, 420, 4)
+        assert not hasattr(s, "__dict__")
+        with pytest.raises(AttributeError):
+            s.extra = 1
+
     def test_beta1_low_fc(self):
         s = BeamSection(30, 50, 21, 420, 4)
         assert s.beta1 == 0.85
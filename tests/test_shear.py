@@ -1,12 +1,14 @@
+import math
+
 import pytest
 
+from src.models.result_types import STATUS_CODE_DTYPE, Status
 from src.models.section import BeamSection
-from src.models.shear import calculate_shear
-
+from src.models.shear import calculate_shear, calculate_shear_batch, calculate_shear_fast
 
-@pytest.fixture
-def standard_section():
-    return BeamSection(b=30, h=50, fc=28, fy=420, cover=4)
+EXPECTED_KEYS = frozenset(
+    {'Vc', 'phi_Vc', 'Vs_req', 's_req', 's_max', 'status', 'status_code', 'Av', 'Av_bar_cm2', 'trace'}
+)
 
 
 class TestShear:
@@ -29,13 +31,18 @@ class TestShear:
 
     def test_all_keys_present(self, standard_section):
         res = calculate_shear(standard_section, 100)
-        expected = {'Vc', 'phi_Vc', 'Vs_req', 's_req', 's_max', 'status', 'status_code', 'Av', 'Av_bar_cm2', 'trace'}
-        assert expected == set(res.keys())
+        assert EXPECTED_KEYS == set(res.keys())
 
     def test_all_keys_on_no_stirrups(self, standard_section):
         res = calculate_shear(standard_section, 5)
-        expected = {'Vc', 'phi_Vc', 'Vs_req', 's_req', 's_max', 'status', 'status_code', 'Av', 'Av_bar_cm2', 'trace'}
-        assert expected == set(res.keys())
+        assert EXPECTED_KEYS == set(res.keys())
+
+    def test_minimum_stirrups_when_vs_not_required(self, standard_section):
+        # 0.5*phi*Vc < Vu < phi*Vc: Vs_req <= 0, spacing set by the limits
+        res = calculate_shear(standard_section, 80)
+        assert res['status'] == "Minimum Stirrups Required"
+        assert res['Vs_req'] == 0
+        assert res['s_req'] == pytest.approx(res['s_max'])
 
     def test_negative_vu_uses_abs(self, standard_section):
         r1 = calculate_shear(standard_section, 100)
@@ -66,3 +73,54 @@ class TestShear:
         assert res['status_code'] in {'ok', 'warning', 'error'}
         assert isinstance(res['trace'], list)
         assert len(res['trace']) >= 1
+
+    @pytest.mark.parametrize("Vu", [5, -100, 1000])
+    def test_without_trace(self, standard_section, Vu):
+        traced = calculate_shear(standard_section, Vu)
+        untraced = calculate_shear(standard_section, Vu, with_trace=False)
+        assert untraced.trace == []
+        assert untraced.status == traced.status
+        assert untraced.s_req == traced.s_req
+
+    @pytest.mark.parametrize("Vu", [5, 100, -100, 1000])
+    def test_fast_matches_full(self, standard_section, Vu):
+        full = calculate_shear(standard_section, Vu, 3, 1.27)
+        fast = calculate_shear_fast(standard_section, Vu, 3, 1.27)
+        assert fast._asdict() == {k: getattr(full, k) for k in fast._fields}
+
+    def test_fast_invalid_section(self):
+        fast = calculate_shear_fast(BeamSection(b=30, h=50, fc=28, fy=420, cover=20), 100)
+        assert fast.status_code == Status.ERROR
+
+
+class TestShearBatch:
+    CASES = [
+        # (b, h, fc, fy, cover, Vu)
+        (30, 50, 28, 420, 4, 5),
+        (30, 50, 28, 420, 4, 60),
+        (30, 50, 28, 420, 4, 100),
+        (30, 50, 28, 420, 4, 350),
+        (30, 50, 28, 420, 4, 1000),
+        (25, 60, 35, 420, 5, -150),
+        (40, 80, 21, 280, 4, 300),
+        (10, 50, 28, 420, 6, 100),
+    ]
+
+    def test_batch_matches_scalar(self):
+        columns = list(zip(*self.CASES))
+        batch = calculate_shear_batch(*columns, n_legs=2, stirrup_diameter=0.95)
+        assert batch["status_code"].dtype == STATUS_CODE_DTYPE
+        for i, (b, h, fc, fy, cover, Vu) in enumerate(self.CASES):
+            scalar = calculate_shear(BeamSection(b, h, fc, fy, cover), Vu)
+            assert batch["status_code"][i] == scalar.status_code
+            for key in ("Vc", "phi_Vc", "Vs_req", "Av", "Av_bar_cm2"):
+                assert batch[key][i] == pytest.approx(scalar[key], rel=1e-9, abs=1e-12)
+            for key in ("s_req", "s_max"):
+                if scalar[key] is None:
+                    assert math.isnan(batch[key][i])
+                else:
+                    assert batch[key][i] == pytest.approx(scalar[key], rel=1e-9)
+
+    def test_scalar_inputs_broadcast(self):
+        batch = calculate_shear_batch(30, 50, 28, 420, 4, [20, 100, 200])
+        assert batch["s_req"].shape == (3,)
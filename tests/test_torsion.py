@@ -1,48 +1,47 @@
 import pytest
 
+from src.models.result_types import Status
 from src.models.section import BeamSection
-from src.models.torsion import calculate_torsion
+from src.models.torsion import calculate_torsion, calculate_torsion_fast
+from src.models.torsion_kernels import TORSION_AOH_INVALID, _torsion_core
 
-
-@pytest.fixture
-def standard_section():
-    return BeamSection(b=30, h=50, fc=28, fy=420, cover=4)
+EXPECTED_KEYS = frozenset({
+    'Tu', 'T_th', 'phi_T_th', 'T_cr', 'phi_T_cr', 'status', 'status_code',
+    'At_s_req', 'At_s_req_cm2_m', 'Al_req', 'check_cross_section', 'action', 'trace',
+})
 
 
 class TestTorsion:
     def test_negligible_torsion(self, standard_section):
         res = calculate_torsion(standard_section, Tu=1.0, Vu=10.0)
         assert "Neglectable" in res['status']
+        assert res.status_code == Status.OK
         assert res['At_s_req'] == 0.0
         assert res['Al_req'] == 0.0
 
     def test_significant_torsion(self, standard_section):
         res = calculate_torsion(standard_section, Tu=20.0, Vu=50.0)
         assert "Required" in res['status']
+        assert res.status_code == Status.WARNING
         assert res['At_s_req'] > 0
         assert res['Al_req'] > 0
 
     def test_cross_section_failure(self, standard_section):
         res = calculate_torsion(standard_section, Tu=100.0, Vu=500.0)
         assert "Too Small" in res['status'] or "Error" in res['status']
+        assert res.status_code == Status.ERROR
 
     def test_all_keys_on_negligible(self, standard_section):
         res = calculate_torsion(standard_section, Tu=1.0, Vu=10.0)
-        expected = {'Tu', 'T_th', 'phi_T_th', 'T_cr', 'phi_T_cr', 'status',
-                    'status_code', 'At_s_req', 'At_s_req_cm2_m', 'Al_req', 'check_cross_section', 'action', 'trace'}
-        assert expected == set(res.keys())
+        assert EXPECTED_KEYS == set(res.keys())
 
     def test_all_keys_on_required(self, standard_section):
         res = calculate_torsion(standard_section, Tu=20.0, Vu=50.0)
-        expected = {'Tu', 'T_th', 'phi_T_th', 'T_cr', 'phi_T_cr', 'status',
-                    'status_code', 'At_s_req', 'At_s_req_cm2_m', 'Al_req', 'check_cross_section', 'action', 'trace'}
-        assert expected == set(res.keys())
+        assert EXPECTED_KEYS == set(res.keys())
 
     def test_all_keys_on_error(self, standard_section):
         res = calculate_torsion(standard_section, Tu=100.0, Vu=500.0)
-        expected = {'Tu', 'T_th', 'phi_T_th', 'T_cr', 'phi_T_cr', 'status',
-                    'status_code', 'At_s_req', 'At_s_req_cm2_m', 'Al_req', 'check_cross_section', 'action', 'trace'}
-        assert expected == set(res.keys())
+        assert EXPECTED_KEYS == set(res.keys())
 
     def test_section_too_small_for_cover(self):
         """Section where cover is almost as big as the section."""
@@ -82,3 +81,24 @@ class TestTorsion:
         assert res['status_code'] in {'ok', 'warning', 'error'}
         assert isinstance(res['trace'], list)
         assert len(res['trace']) >= 1
+
+    @pytest.mark.parametrize("Tu, Vu", [(1.0, 10.0), (-20.0, -50.0), (100.0, 500.0)])
+    def test_without_trace(self, standard_section, Tu, Vu):
+        traced = calculate_torsion(standard_section, Tu, Vu)
+        untraced = calculate_torsion(standard_section, Tu, Vu, with_trace=False)
+        assert untraced.trace == []
+        assert untraced.status == traced.status
+        assert untraced.Al_req == traced.Al_req
+
+    @pytest.mark.parametrize("Tu, Vu", [(1.0, 10.0), (20.0, 50.0), (-20.0, -50.0), (100.0, 500.0)])
+    def test_fast_matches_full(self, standard_section, Tu, Vu):
+        full = calculate_torsion(standard_section, Tu, Vu)
+        fast = calculate_torsion_fast(standard_section, Tu, Vu)
+        assert fast._asdict() == {k: getattr(full, k) for k in fast._fields}
+
+    @pytest.mark.parametrize("x1, y1", [(-10.0, 300.0), (0.0, 300.0), (-10.0, -20.0)])
+    def test_core_flags_invalid_aoh(self, x1, y1):
+        out = _torsion_core(20e6, 50e3, 28 ** 0.5, 420.0, 300.0, 460.0,
+                            150e3, 1600.0, x1 * y1, 2 * (x1 + y1), 100e3)
+        assert out[0] == TORSION_AOH_INVALID
+        assert out[1:] == (0.0,) * 8
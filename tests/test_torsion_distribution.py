@@ -1,3 +1,7 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from src.models.torsion_distribution import distribute_torsion_longitudinal_reinf
 
 
@@ -14,3 +18,18 @@ def test_distribution_conserves_total_area():
     total = dist.al_bottom + dist.al_top + 2 * dist.al_side_each
     assert abs(total - 6.0) < 1e-9
     assert dist.n_bars >= 4
+
+
+def test_distribution_is_cached_and_frozen():
+    dist = distribute_torsion_longitudinal_reinf(6.0, 30, 50, 4, 8)
+    assert distribute_torsion_longitudinal_reinf(6.0, 30, 50, 4, 8) is dist
+    with pytest.raises(FrozenInstanceError):
+        dist.al_total = 0.0  # type: ignore[misc]
+
+
+@pytest.mark.parametrize("n_bars", [4, 5, 7, 8, 11])
+@pytest.mark.parametrize("b, h", [(30, 50), (60, 12), (20, 80)])
+def test_distribution_places_every_bar(n_bars, b, h):
+    dist = distribute_torsion_longitudinal_reinf(6.0, b, h, 4, n_bars)
+    assert dist.n_bottom + dist.n_top + 2 * dist.n_side_each == n_bars
+    assert dist.n_bottom >= 2 and dist.n_top >= 2